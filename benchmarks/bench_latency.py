@@ -0,0 +1,159 @@
+"""End-to-end latency breakdown of one SWOT request, stage by stage.
+
+Runs against the offline fake backend by default (set SWOT_LLM_BACKEND to
+override) and reports p50/p95/p99 and peak allocations per stage for inputs
+from one sentence to a 50-page document. Results are saved as JSON so runs on
+different commits can be compared:
+
+    python benchmarks/bench_latency.py --runs 30
+    python benchmarks/bench_latency.py --compare benchmarks/results/latency-<commit>.json
+"""
+import argparse
+import json
+import random
+
+import bench_utils
+
+# One "page" is roughly 500 words of prose
+INPUT_SIZES = {
+    "sentence": 20,
+    "paragraph": 120,
+    "page": 500,
+    "10_pages": 5_000,
+    "50_pages": 25_000,
+}
+
+_SENTENCES = [
+    "Acme Corp designs and manufactures industrial widgets for the automotive sector.",
+    "Revenue grew twelve percent last year, driven by demand in North America.",
+    "The company operates three plants and employs roughly four thousand people.",
+    "Its main competitors are larger conglomerates with broader product ranges.",
+    "Management plans to expand into Asia through distribution partnerships.",
+    "Raw material costs rose sharply during the period, compressing margins.",
+    "A new software platform lets customers monitor widget performance remotely.",
+    "Regulators are reviewing emissions standards that affect several product lines.",
+]
+
+
+def company_details(words):
+    """Deterministic synthetic company description of about `words` words."""
+    rng = random.Random(words)
+    text, count = [], 0
+    while count < words:
+        sentence = rng.choice(_SENTENCES)
+        text.append(sentence)
+        count += len(sentence.split())
+    return " ".join(text)
+
+
+def render(swot_text, key_points):
+    """The Streamlit calls the app makes for one result, executed in bare mode."""
+    import streamlit as st
+
+    st.markdown(swot_text, unsafe_allow_html=False)
+    for name, items in zip(("Strengths", "Weaknesses", "Opportunities", "Threats"), key_points):
+        st.markdown(f"### {name}")
+        for item in items or [f"No {name} Identified"]:
+            st.write(f"- {item}")
+
+
+def build_stages(swot_core):
+    """Returns (name, function) pairs; each takes and returns the running request state."""
+    from swot_parser import parse_swot
+
+    prompt_template = swot_core.get_prompt_template()
+    ai_model = swot_core.get_ai_model()
+
+    def prompt_format(state):
+        state["prompt"] = prompt_template.format(context=state["input"])
+
+    def model_call(state):
+        state["response"] = swot_core._response_from_message(ai_model.invoke(state["prompt"]))
+
+    def parse(state):
+        swot = parse_swot(state["response"])
+        state["swot_text"], state["key_points"] = swot.text, swot.key_points(3)
+
+    def token_accounting(state):
+        swot_core.count_tokens.cache_clear()  # Measure a fresh request, not a memoized repeat
+        state["tokens"] = swot_core.token_usage(state["input"], state["response"])
+
+    def render_result(state):
+        render(state["swot_text"], state["key_points"])
+
+    return [
+        ("prompt_format", prompt_format),
+        ("model_call", model_call),
+        ("parse_swot", parse),
+        ("token_accounting", token_accounting),
+        ("render", render_result),
+    ]
+
+
+def run(runs, sizes):
+    import swot_core
+    from streamlit import logger
+
+    logger.set_log_level("error")  # Bare-mode rendering warns on every call
+    stages = build_stages(swot_core)
+    results = {}
+    for size_name in sizes:
+        details = company_details(INPUT_SIZES[size_name])
+        timings = {name: [] for name, _ in stages}
+        totals = []
+        for _ in range(runs):
+            state = {"input": details}
+            total = 0.0
+            for name, stage in stages:
+                _, elapsed = bench_utils.time_call(stage, state)
+                timings[name].append(elapsed)
+                total += elapsed
+            totals.append(total)
+
+        # Allocation pass, separate so tracemalloc overhead does not skew timings
+        state = {"input": details}
+        report = {}
+        for name, stage in stages:
+            report[name] = bench_utils.summarize(timings[name])
+            report[name]["peak_alloc_kb"] = bench_utils.peak_allocation_kb(stage, state)
+        report["total"] = bench_utils.summarize(totals)
+        results[size_name] = {"input_chars": len(details), "stages": report}
+    return results
+
+
+def print_report(results, baseline=None):
+    for size_name, size in results.items():
+        print(f"\n{size_name} ({size['input_chars']:,} chars)")
+        print(f"  {'stage':<26}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak KiB':>11}{'p50 vs base':>13}")
+        for name, stats in size["stages"].items():
+            delta = ""
+            if baseline:
+                old = baseline.get("sizes", {}).get(size_name, {}).get("stages", {}).get(name)
+                if old and old["p50_ms"]:
+                    delta = f"{(stats['p50_ms'] / old['p50_ms'] - 1) * 100:+.1f}%"
+            peak = f"{stats['peak_alloc_kb']:.1f}" if "peak_alloc_kb" in stats else ""
+            print(f"  {name:<26}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}{peak:>11}{delta:>13}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--sizes", nargs="+", choices=list(INPUT_SIZES), default=list(INPUT_SIZES))
+    parser.add_argument("--fake-latency-ms", type=float, default=100.0, help="Median fake model latency")
+    parser.add_argument("--output", help="JSON output path (default benchmarks/results/latency-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare p50s against")
+    args = parser.parse_args()
+
+    bench_utils.use_fake_backend(args.fake_latency_ms)
+    results = {"environment": bench_utils.environment(), "runs": args.runs, "sizes": run(args.runs, args.sizes)}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    print_report(results["sizes"], baseline)
+    print(f"\nSaved {bench_utils.save_results('latency', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
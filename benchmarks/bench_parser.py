@@ -0,0 +1,106 @@
+"""Parser scaling benchmark on multi-megabyte SWOT responses.
+
+Compares the original clean_swot_text + extract_swot_key_points pair with the
+single-pass parse_swot and the streaming parser, and checks that time per MiB
+stays flat as the response grows (linear scaling):
+
+    python benchmarks/bench_parser.py --sizes-mib 1 2 4 8
+"""
+import argparse
+
+import bench_utils
+from swot_fake_llm import fake_swot_text
+from swot_parser import SWOTStreamParser, parse_swot
+
+
+# ✅ The Original Two-Pass Implementation, kept here as the baseline
+def legacy_clean_swot_text(raw_response):
+    if isinstance(raw_response, dict) and "content" in raw_response:
+        swot_text = raw_response["content"]
+    else:
+        swot_text = str(raw_response)
+    swot_text = swot_text.split("additional_kwargs")[0]
+    swot_text = swot_text.replace("\\n", "\n")
+    return swot_text.strip()
+
+
+def legacy_extract_swot_key_points(swot_text):
+    strengths, weaknesses, opportunities, threats = [], [], [], []
+    category = None
+    for line in swot_text.split("\n"):
+        line = line.strip()
+        if "Strengths" in line:
+            category = strengths
+        elif "Weaknesses" in line:
+            category = weaknesses
+        elif "Opportunities" in line:
+            category = opportunities
+        elif "Threats" in line:
+            category = threats
+        elif line.startswith("*"):
+            category.append(line[1:].strip())
+    return strengths[:3], weaknesses[:3], opportunities[:3], threats[:3]
+
+
+def legacy(response):
+    return legacy_extract_swot_key_points(legacy_clean_swot_text(response))
+
+
+def single_pass(response):
+    return parse_swot(response).key_points(3)
+
+
+def streaming(response, chunk_chars=64):
+    text = response["content"]
+    parser = SWOTStreamParser()
+    for start in range(0, len(text), chunk_chars):
+        parser.feed(text[start:start + chunk_chars])
+    parser.close()
+    return parser.key_points(3)
+
+
+def response_of_size(mib):
+    """A SWOT response of about `mib` MiB made of repeated fake analyses."""
+    target = int(mib * 1024 * 1024)
+    parts, size, index = [], 0, 0
+    while size < target:
+        part = fake_swot_text(f"Company Details: Company{index} Holdings")
+        parts.append(part)
+        size += len(part) + 2
+        index += 1
+    return {"content": "\n\n".join(parts)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mib", nargs="+", type=float, default=[1, 2, 4, 8])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="JSON output path (default benchmarks/results/parser-<commit>.json)")
+    args = parser.parse_args()
+
+    implementations = [("legacy", legacy), ("parse_swot", single_pass), ("stream_parser", streaming)]
+    results = {"environment": bench_utils.environment(), "runs": args.runs, "sizes": {}}
+    print(f"{'size':>8} {'implementation':<15}{'p50 ms':>10}{'ms / MiB':>10}")
+    for mib in args.sizes_mib:
+        response = response_of_size(mib)
+        assert single_pass(response) == streaming(response) == legacy(response)
+        size_results = results["sizes"][str(mib)] = {}
+        for name, implementation in implementations:
+            samples = [bench_utils.time_call(implementation, response)[1] for _ in range(args.runs)]
+            stats = bench_utils.summarize(samples)
+            stats["ms_per_mib"] = stats["p50_ms"] / mib
+            size_results[name] = stats
+            print(f"{mib:>6.1f}Mi {name:<15}{stats['p50_ms']:>10.2f}{stats['ms_per_mib']:>10.2f}")
+
+    # Linear scaling means ms/MiB at the largest size stays close to the smallest
+    smallest, largest = str(args.sizes_mib[0]), str(args.sizes_mib[-1])
+    for name, _ in implementations:
+        ratio = results["sizes"][largest][name]["ms_per_mib"] / results["sizes"][smallest][name]["ms_per_mib"]
+        results.setdefault("scaling", {})[name] = ratio
+        print(f"{name:<15} ms/MiB growth {smallest} -> {largest} MiB: {ratio:.2f}x (1.0 = linear)")
+
+    print(f"\nSaved {bench_utils.save_results('parser', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
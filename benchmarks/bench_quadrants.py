@@ -0,0 +1,70 @@
+"""Wall-clock latency of the single-prompt SWOT versus four parallel quadrant prompts.
+
+Both paths call the model directly (no cache, no rate limiter) and include
+parsing, so the comparison is what a user waits for end to end. Runs against
+the offline fake backend by default, whose generation time scales with the
+number of sections written:
+
+    python benchmarks/bench_quadrants.py --runs 20 --fake-latency-ms 2000
+"""
+import argparse
+import asyncio
+
+import bench_utils
+from bench_latency import INPUT_SIZES, company_details
+
+
+async def single_prompt(swot_core, details):
+    from swot_parser import parse_swot
+
+    message = await swot_core.get_swot_chain().ainvoke({"context": details})
+    return parse_swot(swot_core._response_from_message(message))
+
+
+async def parallel_quadrants(swot_core, details):
+    from swot_parser import SECTIONS
+    from swot_quadrants import merge_quadrants, quadrant_points
+
+    async def section_points(section):
+        message = await swot_core.get_quadrant_chain(section).ainvoke({"context": details})
+        return quadrant_points(section, swot_core._response_from_message(message))
+
+    return merge_quadrants(await asyncio.gather(*(section_points(section) for section in SECTIONS)))
+
+
+def run(runs, sizes):
+    import swot_core
+
+    paths = [("single_prompt", single_prompt), ("parallel_quadrants", parallel_quadrants)]
+    results = {}
+    for size_name in sizes:
+        details = company_details(INPUT_SIZES[size_name])
+        report = results[size_name] = {"input_chars": len(details)}
+        for name, path in paths:
+            samples = [bench_utils.time_call(asyncio.run, path(swot_core, details))[1] for _ in range(runs)]
+            report[name] = bench_utils.summarize(samples)
+        report["speedup_p50"] = report["single_prompt"]["p50_ms"] / report["parallel_quadrants"]["p50_ms"]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--sizes", nargs="+", choices=list(INPUT_SIZES), default=["paragraph", "page"])
+    parser.add_argument("--fake-latency-ms", type=float, default=1000.0, help="Median fake latency of a full SWOT")
+    parser.add_argument("--output", help="JSON output path (default benchmarks/results/quadrants-<commit>.json)")
+    args = parser.parse_args()
+
+    bench_utils.use_fake_backend(args.fake_latency_ms)
+    results = {"environment": bench_utils.environment(), "runs": args.runs, "sizes": run(args.runs, args.sizes)}
+
+    print(f"{'size':<12}{'path':<20}{'p50 ms':>10}{'p95 ms':>10}")
+    for size_name, size in results["sizes"].items():
+        for name in ("single_prompt", "parallel_quadrants"):
+            print(f"{size_name:<12}{name:<20}{size[name]['p50_ms']:>10.1f}{size[name]['p95_ms']:>10.1f}")
+        print(f"{size_name:<12}{'speedup (p50)':<20}{size['speedup_p50']:>9.2f}x")
+    print(f"\nSaved {bench_utils.save_results('quadrants', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures per-rerun setup overhead before and after the shared resource registry.
+
+Usage: python benchmarks/bench_rerun.py [--reruns 50]
+"""
+import argparse
+import os
+import statistics
+import time
+
+import bench_utils
+
+# Building the model client does not call the network, so a placeholder key is enough.
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder-key")
+
+import swot_core  # noqa: E402
+
+
+def rebuild_every_rerun():
+    """What the script used to do on every Streamlit rerun."""
+    prompt_template = swot_core._build_prompt_template()
+    ai_model = swot_core._build_ai_model()
+    swot_chain = prompt_template | ai_model
+    encoder = swot_core._build_encoder()
+    return swot_chain, encoder
+
+
+def lookup_from_registry():
+    """What the script does now on every Streamlit rerun."""
+    return swot_core.get_swot_chain(), swot_core.get_encoder()
+
+
+def time_reruns(step, reruns):
+    samples = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        step()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label, samples):
+    stats = bench_utils.summarize(samples)
+    print(f"{label:<22} mean {stats['mean_ms']:9.3f} ms   p50 {stats['p50_ms']:9.3f} ms   p95 {stats['p95_ms']:9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=50)
+    args = parser.parse_args()
+
+    swot_core.clear_resources()
+    start = time.perf_counter()
+    swot_core.warm_up()
+    print(f"{'warm-up (once)':<22} {(time.perf_counter() - start) * 1000:9.3f} ms")
+
+    before = time_reruns(rebuild_every_rerun, args.reruns)
+    after = time_reruns(lookup_from_registry, args.reruns)
+    report("before: rebuild", before)
+    report("after: registry", after)
+    print(f"speed-up (mean)        {statistics.mean(before) / max(statistics.mean(after), 1e-9):9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Success rate and tail latency of model calls under injected faults, per resilience policy.
+
+Each policy makes the same direct model calls (no cache, no rate limiter)
+against the offline fake backend with a share of 503 errors and of calls slowed
+down by --slow-factor, so the effect of retries, hedging and the fallback model
+shows up in the failure count and in p95/p99:
+
+    python benchmarks/bench_resilience.py --runs 100 --error-rate 0.1 --slow-rate 0.05
+"""
+import argparse
+import os
+
+import bench_utils
+from bench_latency import INPUT_SIZES, company_details
+
+# name -> ResiliencePolicy arguments, and whether the fallback model is used
+POLICIES = {
+    "none": ({"max_retries": 0, "timeout_seconds": 0, "hedge": "off"}, False),
+    "retries": ({"timeout_seconds": 0, "hedge": "off"}, False),
+    "retries_hedge_p95": ({"timeout_seconds": 0, "hedge": "p95"}, False),
+    "retries_hedge_fallback": ({"hedge": "p95"}, True),
+}
+
+
+def run(runs, details, timeout_seconds, backoff_seconds):
+    import swot_core
+    import swot_resilience as resilience
+
+    prompt = swot_core.get_swot_chain().first.invoke({"context": details})
+
+    def call(model_name=swot_core.MODEL_NAME):
+        return swot_core.get_swot_chain(model_name).last.invoke(prompt)
+
+    results = {}
+    for name, (overrides, use_fallback) in POLICIES.items():
+        settings = {"timeout_seconds": timeout_seconds, "backoff_seconds": backoff_seconds, **overrides}
+        policy = resilience.ResiliencePolicy(**settings)
+        fallback = (lambda: call(swot_core.FALLBACK_MODEL_NAME)) if use_fallback else None
+        samples, failures = [], 0
+        for _ in range(runs):
+            try:
+                _, elapsed_ms = bench_utils.time_call(resilience.call_resilient_sync, policy, call, fallback)
+            except Exception:
+                failures += 1
+                continue
+            samples.append(elapsed_ms)
+        report = results[name] = bench_utils.summarize(samples) if samples else {"runs": 0}
+        report.update(success_rate=len(samples) / runs, failures=failures, events=dict(policy.stats))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--size", choices=list(INPUT_SIZES), default="paragraph")
+    parser.add_argument("--fake-latency-ms", type=float, default=200.0, help="Median fake latency of a full SWOT")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="Share of calls that fail with a 503")
+    parser.add_argument("--slow-rate", type=float, default=0.05, help="Share of calls slowed down")
+    parser.add_argument("--slow-factor", type=float, default=10.0)
+    parser.add_argument("--timeout-seconds", type=float, default=1.0, help="Primary model timeout before falling back")
+    parser.add_argument("--backoff-seconds", type=float, default=0.05)
+    parser.add_argument("--output", help="JSON output path (default benchmarks/results/resilience-<commit>.json)")
+    args = parser.parse_args()
+
+    bench_utils.use_fake_backend(args.fake_latency_ms)
+    os.environ["SWOT_FAKE_ERROR_RATE"] = str(args.error_rate)
+    os.environ["SWOT_FAKE_SLOW_RATE"] = str(args.slow_rate)
+    os.environ["SWOT_FAKE_SLOW_FACTOR"] = str(args.slow_factor)
+    details = company_details(INPUT_SIZES[args.size])
+    results = {
+        "environment": bench_utils.environment(), "runs": args.runs, "error_rate": args.error_rate,
+        "slow_rate": args.slow_rate, "policies": run(args.runs, details, args.timeout_seconds, args.backoff_seconds),
+    }
+
+    print(f"{'policy':<26}{'success':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  events")
+    for name, report in results["policies"].items():
+        latencies = "".join(f"{report.get(key, float('nan')):>10.1f}" for key in ("p50_ms", "p95_ms", "p99_ms"))
+        print(f"{name:<26}{report['success_rate']:>8.0%} {latencies}  {report['events']}")
+    print(f"\nSaved {bench_utils.save_results('resilience', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
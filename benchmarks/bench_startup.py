@@ -0,0 +1,111 @@
+"""Cold-start benchmark: import-time breakdown and time to first render of the app.
+
+Every measurement runs in a fresh interpreter so nothing is already imported.
+Imports are timed with `python -X importtime` over the app's own top-level
+imports; time to first render is one bare AppTest run of the script (form only,
+nothing generated) on the fake backend. Exits non-zero when a median exceeds
+its budget, so it can gate a CI job:
+
+    python benchmarks/bench_startup.py --runs 5 --import-budget-ms 1500 --render-budget-ms 4000
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+import bench_utils
+
+APP_SCRIPT = os.path.join(bench_utils.REPO_ROOT, "smriti_swot_analysis.py")
+
+_FIRST_RENDER = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+AppTest.from_file({script!r}, default_timeout=120).run()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def app_imports(script=APP_SCRIPT):
+    """Top-level modules the app script imports, in order."""
+    with open(script, encoding="utf-8") as handle:
+        tree = ast.parse(handle.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        modules.extend(name for name in names if name not in modules)
+    return modules
+
+
+def import_times(modules):
+    """{module: cumulative import ms} for one cold interpreter, from -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {module}" for module in modules)],
+        cwd=bench_utils.REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit() and name.strip() in modules and not name[1:].startswith(" "):
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def first_render_ms():
+    completed = subprocess.run(
+        [sys.executable, "-c", _FIRST_RENDER.format(script=APP_SCRIPT)],
+        cwd=bench_utils.REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=1500.0, help="Max median time for the app's imports")
+    parser.add_argument("--render-budget-ms", type=float, default=4000.0, help="Max median time to first render")
+    parser.add_argument("--output", help="JSON output path (default benchmarks/results/startup-<commit>.json)")
+    args = parser.parse_args()
+
+    bench_utils.use_fake_backend(0)
+    modules = app_imports()
+    samples = [import_times(modules) for _ in range(args.runs)]
+    imports = {module: bench_utils.summarize([sample.get(module, 0.0) for sample in samples]) for module in modules}
+    import_total = bench_utils.summarize([sum(sample.values()) for sample in samples])
+    render = bench_utils.summarize([first_render_ms() for _ in range(args.runs)])
+
+    print(f"{'import':<28}{'p50 ms':>10}{'p95 ms':>10}")
+    for module, stats in sorted(imports.items(), key=lambda item: -item[1]["p50_ms"]):
+        print(f"{module:<28}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}")
+    print(f"{'all app imports':<28}{import_total['p50_ms']:>10.1f}{import_total['p95_ms']:>10.1f}")
+    print(f"{'time to first render':<28}{render['p50_ms']:>10.1f}{render['p95_ms']:>10.1f}")
+
+    results = {
+        "environment": bench_utils.environment(),
+        "runs": args.runs,
+        "imports": imports,
+        "import_total": import_total,
+        "first_render": render,
+        "budgets_ms": {"imports": args.import_budget_ms, "first_render": args.render_budget_ms},
+    }
+    print(f"\nSaved {bench_utils.save_results('startup', results, args.output)}")
+
+    over_budget = []
+    if import_total["p50_ms"] > args.import_budget_ms:
+        over_budget.append(f"imports {import_total['p50_ms']:.0f} ms > {args.import_budget_ms:.0f} ms")
+    if render["p50_ms"] > args.render_budget_ms:
+        over_budget.append(f"first render {render['p50_ms']:.0f} ms > {args.render_budget_ms:.0f} ms")
+    if over_budget:
+        sys.exit("Startup regression: " + "; ".join(over_budget))
+
+
+if __name__ == "__main__":
+    main()
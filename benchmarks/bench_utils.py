@@ -0,0 +1,83 @@
+"""Small helpers shared by the benchmark scripts."""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def use_fake_backend(latency_ms=None):
+    """Points swot_core at the offline fake model unless a backend was chosen explicitly."""
+    os.environ.setdefault("SWOT_LLM_BACKEND", "fake")
+    if latency_ms is not None:
+        os.environ["SWOT_FAKE_LATENCY_MS"] = str(latency_ms)
+
+
+def percentile(sorted_samples, fraction):
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def summarize(samples_ms):
+    """Returns mean/p50/p95/p99 for a list of millisecond timings."""
+    ordered = sorted(samples_ms)
+    return {
+        "runs": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered),
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+    }
+
+
+def time_call(func, *args, **kwargs):
+    """Runs func once and returns (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def peak_allocation_kb(func, *args, **kwargs):
+    """Peak Python heap allocated while running func once, in KiB."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def environment():
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": os.getenv("SWOT_LLM_BACKEND", "gemini"),
+    }
+
+
+def save_results(name, results, output=None):
+    """Writes results as JSON, by default to benchmarks/results/<name>-<commit>.json."""
+    path = output or os.path.join(RESULTS_DIR, f"{name}-{results['environment']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+    return path
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+
+import altair as alt
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # The swot_* modules live one level up
+
+from swot_tracing import DEFAULT_TRACE_PATH, read_trace, read_traces
+
+# ✅ Debug Page: Waterfall of the Spans Recorded for each Request
+st.set_page_config(page_title="SWOT Trace Viewer")
+st.title("🔍 Request Traces")
+st.caption(f"Reading {DEFAULT_TRACE_PATH}")
+
+traces = read_traces(limit=st.sidebar.number_input("Recent requests", min_value=1, max_value=500, value=50))
+if not traces:
+    st.info("No traces yet. Generate a SWOT analysis and come back.")
+    st.stop()
+
+def trace_label(request_id):
+    spans = traces[request_id]
+    root = min(spans, key=lambda span: span["span_id"])
+    started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(root["timestamp"]))
+    return f"{started} · {root['name']} · {root['duration_ms'] / 1000:.2f}s · {request_id}"
+
+request_id = st.selectbox("Request", list(traces), format_func=trace_label)
+query_request_id = st.text_input("Or look up a request ID")
+request_spans = traces[request_id]
+if query_request_id:
+    request_spans = traces.get(query_request_id) or read_trace(query_request_id)
+    if request_spans is None:
+        st.error("No trace with that request ID.")
+        st.stop()
+
+spans = sorted(request_spans, key=lambda span: (span["start_ms"], span["span_id"]))
+
+# Indent span names by depth so nested stages read like a call tree
+depth = {}
+for span in spans:
+    depth[span["span_id"]] = depth.get(span["parent_id"], -1) + 1
+rows = [
+    {
+        "order": index,
+        "span": f"{'  ' * depth[span['span_id']]}{span['name']}",
+        "start_ms": span["start_ms"],
+        "end_ms": span["start_ms"] + span["duration_ms"],
+        "duration_ms": span["duration_ms"],
+        "status": "error" if span.get("error") else "ok",
+        "attributes": ", ".join(f"{key}={value}" for key, value in span["attributes"].items()),
+    }
+    for index, span in enumerate(spans)
+]
+
+chart = (
+    alt.Chart(alt.Data(values=rows))
+    .mark_bar()
+    .encode(
+        x=alt.X("start_ms:Q", title="ms since request start"),
+        x2="end_ms:Q",
+        y=alt.Y("span:N", sort=alt.SortField("order"), title=None),
+        color=alt.Color("status:N", scale=alt.Scale(domain=["ok", "error"], range=["#4c78a8", "#e45756"]), legend=None),
+        tooltip=["span:N", "duration_ms:Q", "start_ms:Q", "attributes:N"],
+    )
+    .properties(height=max(120, 28 * len(rows)))
+)
+st.altair_chart(chart, width="stretch")
+
+# ✅ Where the Time Went
+st.subheader("Stages")
+st.table([{key: row[key] for key in ("span", "start_ms", "duration_ms", "status", "attributes")} for row in rows])
@@ -1,163 +1,416 @@
-import os
-import streamlit as st
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
-import tiktoken
-import pandas as pd  # ✅ Import Pandas for Table Formatting
-
-# ✅ Check Streamlit Version
-print(f"Streamlit Version: {st.__version__}")
-
-# ✅ Check if API key is available
-api_key = os.getenv("GOOGLE_API_KEY")
-if not api_key:
-    st.error("API Key is missing. Set GOOGLE_API_KEY in your environment.")
-    st.stop()
-
-# ✅ Initialize AI Model
-ai_model = ChatGoogleGenerativeAI(model="gemini-1.5-pro-latest", google_api_key=api_key, temperature=0.7)
-
-# ✅ Define the AI Prompt for SWOT Analysis
-swot_prompt = """
-You are an expert business consultant. Given the company information below, provide a **detailed** SWOT Analysis in **structured format only**.
-
-### Strengths  
-(Provide at least 3-5 specific strengths related to the company)  
-
-### Weaknesses  
-(Provide at least 3-5 specific weaknesses)  
-
-### Opportunities  
-(Provide at least 3-5 external opportunities the company can leverage)  
-
-### Threats  
-(Provide at least 3-5 threats, including competitors, market risks, etc.)  
-
-**ONLY return the SWOT analysis without additional explanations.**  
+import asyncio
+import time
 
-Company Details:  
-{context}
-"""
-
-prompt_template = PromptTemplate(input_variables=["context"], template=swot_prompt)
-swot_chain = prompt_template | ai_model  # ✅ New LangChain method
-
-# ✅ Token Counter
-encoder = tiktoken.get_encoding("cl100k_base")
-
-# ✅ Function to Generate SWOT
-def analyze_swot(input_text):
-    return swot_chain.invoke({"context": input_text})
-
-# ✅ Function to Extract Only SWOT Content
-def clean_swot_text(raw_response):
-    """Extracts the SWOT content and removes unwanted metadata."""
-    if isinstance(raw_response, dict) and "content" in raw_response:
-        swot_text = raw_response["content"]
-    else:
-        swot_text = str(raw_response)
-
-    # ✅ Remove extra metadata (if exists)
-    swot_text = swot_text.split("additional_kwargs")[0]  # Removes AI metadata
-    swot_text = swot_text.replace("\\n", "\n")  # Fixes line breaks
-    swot_text = swot_text.strip()  # Cleans whitespace
-
-    return swot_text
-
-# ✅ Function to Extract Key Points for Visualization
-def extract_swot_key_points(swot_text):
-    """Extracts key points from the SWOT text to display in the visualization."""
-    lines = swot_text.split("\n")
-    strengths, weaknesses, opportunities, threats = [], [], [], []
-
-    category = None
-    for line in lines:
-        line = line.strip()
-        if "Strengths" in line:
-            category = strengths
-        elif "Weaknesses" in line:
-            category = weaknesses
-        elif "Opportunities" in line:
-            category = opportunities
-        elif "Threats" in line:
-            category = threats
-        elif line.startswith("*"):
-            category.append(line[1:].strip())  # Remove * bullet points
-
-    # ✅ Show only **top 3 key points** per category in visualization
-    return strengths[:3], weaknesses[:3], opportunities[:3], threats[:3]
+import streamlit as st
+import swot_metrics as metrics
+import swot_tracing as tracing
+from swot_core import (
+    SWOTStream, analyze_swot, get_rate_limiter, get_single_flight, parse_response, token_usage, warm_up,
+)
+from swot_budget import DEFAULT_PROMPT_TOKEN_BUDGET, plan_input
+from swot_compare import company_names, compare_companies_async
+from swot_history import get_history_store
+from swot_mapreduce import map_reduce_swot_async
+from swot_parser import SECTIONS, SWOTStreamParser
+from swot_quadrants import quadrant_swot_async
+from swot_routing import ROUTES, call_cost
+from swot_structured import StructuredOutputError
 
 # ✅ Streamlit Web App UI
 st.set_page_config(page_title="SWOT Analysis AI Agent")
 st.title("📌 AI-Powered SWOT Analysis App")
 st.write("Enter company details to generate a SWOT analysis.")
 
-# ✅ Text Input Box
-company_details = st.text_area("Enter company details:")
-
-# Initialize analysis_result to avoid errors
-analysis_result = ""
-
-if st.button("Generate SWOT"):
-    with st.spinner("Generating analysis..."):
-        analysis_result = analyze_swot(company_details)
-
-    # ✅ Extract Clean SWOT Text
-    swot_text = clean_swot_text(analysis_result)
-
-    # ✅ Display Full SWOT Analysis with Proper Formatting
-    st.subheader("📌 SWOT Analysis")
-    st.markdown(swot_text, unsafe_allow_html=False)
-
-    # ✅ Extract Key Points for Visualization
-    strengths, weaknesses, opportunities, threats = extract_swot_key_points(swot_text)
-
-    # ✅ Create a 2x2 Layout (Like the Image)
-    st.subheader("📊 SWOT Analysis - Key Points")
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("### 🟦 Strengths")
-        if strengths:
-            for item in strengths:
+# ✅ Text Input Box, a Long Document Analyzed Chunk by Chunk, or Several Companies Side by Side
+input_mode = st.radio("Input", ["Company details", "Long document", "Compare companies"], horizontal=True)
+document_mode = input_mode == "Long document"
+compare_mode = input_mode == "Compare companies"
+if document_mode:
+    uploaded_document = st.file_uploader("Upload a document (.txt or .md):", type=["txt", "md"])
+    if uploaded_document is not None:
+        company_details = uploaded_document.getvalue().decode("utf-8", errors="replace")
+    else:
+        company_details = st.text_area("Or paste the document:", height=300)
+elif compare_mode:
+    company_count = st.number_input("Companies to compare", min_value=2, max_value=6, value=3)
+    companies = []
+    for company_index in range(company_count):
+        name_column, details_column = st.columns([1, 3])
+        company_name = name_column.text_input(
+            "Name", key=f"compare_name_{company_index}", placeholder=f"Company {company_index + 1}"
+        )
+        companies.append((company_name, details_column.text_area("Details", key=f"compare_details_{company_index}")))
+else:
+    company_details = st.text_area("Enter company details:")
+
+structured_output = st.checkbox("Structured JSON output (no text scraping)", value=False)
+deep_analysis = st.checkbox("Deep analysis (always use the pro model, whatever the input length)", value=False)
+parallel_output = st.checkbox(
+    "Generate the four quadrants in parallel", value=False, disabled=structured_output or document_mode or compare_mode
+) and not (structured_output or document_mode or compare_mode)
+stream_output = st.checkbox(
+    "Stream the analysis as it is generated", value=True,
+    disabled=structured_output or document_mode or compare_mode or parallel_output,
+) and not (structured_output or document_mode or compare_mode or parallel_output)
+
+# ✅ Quadrants of the Key Points Grid: (title, section name)
+QUADRANTS = [
+    ("🟦 Strengths", "Strengths"),
+    ("🟦 Weaknesses", "Weaknesses"),
+    ("🟩 Opportunities", "Opportunities"),
+    ("🟧 Threats", "Threats"),
+]
+
+def render_quadrant(placeholder, title, name, items):
+    """Fills one cell of the 2x2 key points grid."""
+    with placeholder.container():
+        st.markdown(f"### {title}")
+        if items:
+            for item in items:
                 st.write(f"- {item}")
         else:
-            st.write("- No Strengths Identified")
-
-    with col2:
-        st.markdown("### 🟦 Weaknesses")
-        if weaknesses:
-            for item in weaknesses:
+            st.write(f"- No {name} Identified")
+
+def comparison_matrix(names):
+    """Lays out one column per company and one row per quadrant; returns the cells as [quadrant][company]."""
+    for column, name in zip(st.columns(len(names)), names):
+        column.markdown(f"**{name}**")
+    cells = []
+    for title, _ in QUADRANTS:
+        st.markdown(f"### {title}")
+        cells.append([column.empty() for column in st.columns(len(names))])
+    return cells
+
+def fill_comparison_column(cells, index, company, limit=3):
+    """Fills one company's column of the comparison matrix."""
+    if company.error is not None:
+        cells[0][index].error(f"Analysis failed: {company.error}")
+        for row in cells[1:]:
+            row[index].empty()
+        return
+    for row, (_, name), items in zip(cells, QUADRANTS, company.result.key_points(limit)):
+        with row[index].container():
+            for item in items or [f"No {name} Identified"]:
                 st.write(f"- {item}")
-        else:
-            st.write("- No Weaknesses Identified")
 
-    col3, col4 = st.columns(2)
-
-    with col3:
-        st.markdown("### 🟩 Opportunities")
-        if opportunities:
-            for item in opportunities:
-                st.write(f"- {item}")
-        else:
-            st.write("- No Opportunities Identified")
+def select_history(entry_id):
+    """Loads a past analysis into session state so it is shown without calling the model."""
+    entry = get_history_store().get(entry_id)
+    if entry is None:
+        return
+    created = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.created_at))
+    tokens = None if entry.prompt_tokens is None else (entry.prompt_tokens, entry.response_tokens, "history")
+    st.session_state.pop("comparison", None)
+    st.session_state.analysis = {
+        "title": f"📌 SWOT Analysis — {entry.company}",
+        "swot": entry.result,
+        "mode": entry.mode,
+        "notes": [f"🕘 From history, {created} ({entry.mode} mode)"],
+        "sidebar_notes": [],
+        "tokens": tokens,
+        "cost": None,
+        "request_id": None,
+    }
+
+# ✅ Shared Rate Limit Queue (all sessions and the batch runner)
+st.sidebar.write(f"Estimated Queue Wait: {get_rate_limiter().current_wait():.1f}s")
+flight_stats = get_single_flight().stats()
+st.sidebar.write(f"Coalesced Requests: {flight_stats['collapsed']} of {flight_stats['executed'] + flight_stats['collapsed']} model calls")
+
+# ✅ Offer the Stored Analysis of an Identical Description instead of Calling the Model again
+if not compare_mode and company_details.strip():
+    previous = get_history_store().latest_for_input(company_details)
+    if previous is not None:
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(previous.created_at))
+        st.button(f"🕘 Load the analysis of this description from {created}", on_click=select_history, args=(previous.id,))
+
+generate = st.button("Generate SWOT")
+
+# ✅ Build Model, Chain and Tokenizer Once per Process, after the Form has Rendered
+# so a cold start paints the page before paying for the heavy model imports
+@st.cache_resource(show_spinner="Loading the model...")
+def load_resources():
+    warm_up()
+    metrics.start_exporter()  # ✅ Prometheus metrics on SWOT_METRICS_PORT
+    return True
+
+try:
+    load_resources()
+except RuntimeError as error:
+    st.error(str(error))
+    st.stop()
 
-    with col4:
-        st.markdown("### 🟧 Threats")
-        if threats:
-            for item in threats:
-                st.write(f"- {item}")
+# ✅ Which Path this Request Takes (used for metrics, traces and history)
+if document_mode:
+    analysis_mode = "document"
+elif compare_mode:
+    analysis_mode = "compare"
+elif parallel_output:
+    analysis_mode = "quadrants"
+elif structured_output:
+    analysis_mode = "structured"
+else:
+    analysis_mode = "stream" if stream_output else "single"
+
+# ✅ Draw the Stored Analysis; its Display Options Rerun only this Fragment, never the Model
+@st.fragment
+def render_analysis():
+    analysis = st.session_state.get("analysis")
+    if analysis is None:
+        return
+    st.subheader(analysis["title"])
+    for note in analysis["notes"]:
+        st.caption(note)
+    option_columns = st.columns(2)
+    show_text = option_columns[0].toggle("Show the full analysis", value=True, key="show_full_text")
+    key_point_limit = option_columns[1].slider("Key points per quadrant", 1, 10, 3, key="key_point_limit")
+
+    with metrics.RENDER_SECONDS.time(mode=analysis["mode"]):
+        swot = analysis["swot"]
+        if show_text:
+            st.markdown(swot.text, unsafe_allow_html=False)
+
+        st.subheader("📊 SWOT Analysis - Key Points")
+        col1, col2 = st.columns(2)
+        col3, col4 = st.columns(2)
+        for column, (title, name), items in zip((col1, col2, col3, col4), QUADRANTS, swot.key_points(key_point_limit)):
+            render_quadrant(column.empty(), title, name, items)
+
+# ✅ Draw the Stored Comparison Matrix; like render_analysis, its Options Rerun only this Fragment
+@st.fragment
+def render_comparison():
+    comparison = st.session_state.get("comparison")
+    if comparison is None:
+        return
+    st.subheader("📊 Competitor Comparison")
+    for note in comparison["notes"]:
+        st.caption(note)
+    key_point_limit = st.slider("Key points per quadrant", 1, 10, 3, key="compare_key_point_limit")
+
+    with metrics.RENDER_SECONDS.time(mode="compare"):
+        cells = comparison_matrix([company.name for company in comparison["companies"]])
+        for index, company in enumerate(comparison["companies"]):
+            fill_comparison_column(cells, index, company, key_point_limit)
+
+if generate and compare_mode:
+    # ✅ Fan Out one Analysis per Company and Fill its Column as soon as it Finishes
+    with tracing.trace("swot_request", mode=analysis_mode) as request_trace:
+        st.session_state.pop("analysis", None)
+        st.session_state.pop("comparison", None)
+        companies = [(name, details) for name, details in companies if details.strip()]
+        if len(companies) < 2:
+            st.warning("Enter the details of at least two companies to compare.")
+            st.stop()
+
+        live_output = st.empty()
+        with live_output.container():
+            st.subheader("📊 Competitor Comparison")
+            cells = comparison_matrix([name for name, _ in company_names(companies)])
+            for row in cells:
+                for cell in row:
+                    cell.caption("⏳ Analyzing...")
+
+        def show_company(index, company):
+            fill_comparison_column(cells, index, company)
+
+        results = asyncio.run(
+            compare_companies_async(companies, structured=structured_output, deep=deep_analysis, on_company=show_company)
+        )
+        reused = sum(bool(company.cache_match) for company in results)
+        query_tokens = sum(company.prompt_tokens for company in results)
+        response_tokens = sum(company.response_tokens for company in results)
+        print(f"Tokens used: Query - {query_tokens}, Response - {response_tokens}")
+
+        st.session_state.comparison = {
+            "companies": results,
+            "notes": [f"⚡ {reused} of {len(results)} companies loaded from cache"] if reused else [],
+            "sidebar_notes": [f"Companies Compared: {len(results)}"],
+            "tokens": (query_tokens, response_tokens, "all company prompts"),
+            "cost": None,
+            "request_id": request_trace.request_id if request_trace is not None else None,
+        }
+        live_output.empty()
+        with tracing.span("render"):
+            render_comparison()
+
+        # ✅ Keep each Company's Analysis in the History Store
+        with tracing.span("history_write"):
+            for company in results:
+                if company.result is not None:
+                    get_history_store().record(
+                        company.details, company.result, analysis_mode, company.prompt_tokens, company.response_tokens,
+                        company=company.name,
+                    )
+elif generate:
+    # ✅ Trace every Stage of the Request (see the Trace Viewer page)
+    with tracing.trace("swot_request", mode=analysis_mode) as request_trace:
+        st.session_state.pop("analysis", None)
+        st.session_state.pop("comparison", None)
+        if document_mode and not company_details.strip():
+            st.warning("Upload or paste a document to analyze.")
+            st.stop()
+        notes, sidebar_notes = [], []
+        if not document_mode:
+            # ✅ Pre-flight Token Budget: Condense Oversized Input before the Model Call
+            with tracing.span("input_prep"):
+                budget = plan_input(company_details, DEFAULT_PROMPT_TOKEN_BUDGET, structured=structured_output)
+            analysis_input = budget.text
+            if budget.original_tokens:
+                sidebar_notes.append(f"Prompt Budget: condensed {budget.original_tokens} → {budget.prompt_tokens} / {budget.budget} tokens")
+                notes.append("✂️ The company details were over the prompt token budget, so only their most informative sentences were analyzed.")
+            else:
+                sidebar_notes.append(f"Prompt Budget: {budget.prompt_tokens} / {budget.budget} tokens")
+
+        # ✅ Lay out the Full Text and a 2x2 Grid (Like the Image) up front, to Fill while Generating
+        live_output = st.empty()
+        with live_output.container():
+            st.subheader("📌 SWOT Analysis")
+            text_placeholder = st.empty()
+
+            st.subheader("📊 SWOT Analysis - Key Points")
+            col1, col2 = st.columns(2)
+            col3, col4 = st.columns(2)
+            quadrant_placeholders = [col1.empty(), col2.empty(), col3.empty(), col4.empty()]
+
+        try:
+            if document_mode:
+                # ✅ Map-Reduce: Analyze Chunks in Parallel, then Merge their Quadrants
+                progress = text_placeholder.progress(0.0, text="Analyzing document chunks...")
+
+                def show_progress(done, total, chunk_result):
+                    progress.progress(done / total, text=f"Analyzed {done} of {total} chunks")
+
+                report = asyncio.run(map_reduce_swot_async(
+                    company_details, structured=structured_output, on_chunk=show_progress, deep=deep_analysis
+                ))
+                swot = report.result
+                sidebar_notes.append(f"Document Chunks: {report.chunks} ({report.reused} reused from cache)")
+            elif parallel_output:
+                # ✅ One Prompt per Quadrant, each Rendered into the Grid as soon as it Finishes
+                text_placeholder.info("Generating the four quadrants in parallel...")
+
+                def show_quadrant(section, points):
+                    index = SECTIONS.index(section)
+                    render_quadrant(quadrant_placeholders[index], *QUADRANTS[index], points[:3])
+
+                report = asyncio.run(quadrant_swot_async(analysis_input, on_quadrant=show_quadrant, deep=deep_analysis))
+                swot = report.result
+                if report.reused:
+                    notes.append(f"⚡ {report.reused} of 4 quadrants loaded from cache")
+            elif stream_output:
+                # ✅ Render Tokens as they Arrive and Fill each Quadrant as its Bullets Complete
+                stream = SWOTStream(analysis_input, deep=deep_analysis)
+                parser = SWOTStreamParser()
+                swot_text = ""
+
+                def show_stream_events(events):
+                    for event in events:
+                        index = SECTIONS.index(event.section)
+                        if event.kind == "section_end" or (event.kind == "bullet" and len(parser.points[event.section]) <= 3):
+                            render_quadrant(quadrant_placeholders[index], *QUADRANTS[index], parser.points[event.section][:3])
+
+                for chunk in stream:
+                    swot_text += chunk
+                    text_placeholder.markdown(swot_text + " ▌", unsafe_allow_html=False)
+                    show_stream_events(parser.feed(chunk))
+                show_stream_events(parser.close())  # The last line has no trailing newline
+
+                analysis_result = stream.response
+                if stream.coalesced:
+                    notes.append("⚡ Joined an identical analysis already in progress")
+            else:
+                with st.spinner("Generating analysis..."):
+                    analysis_result = analyze_swot(analysis_input, structured=structured_output, deep=deep_analysis)
+        except StructuredOutputError as error:
+            live_output.empty()
+            st.error(f"The model returned malformed structured output: {error}")
+            st.stop()
+
+        if not (document_mode or parallel_output):
+            # ✅ Say when the Result was Reused from the Cache
+            cache_match = analysis_result.get("cache_match")
+            if cache_match and cache_match["kind"] == "similar":
+                notes.append(f"⚡ Reused the analysis of a near-identical description (similarity {cache_match['score']:.2f})")
+            elif cache_match:
+                notes.append("⚡ Loaded from cache")
+
+            # ✅ Say which Model Answered and Why
+            route = analysis_result.get("route")  # Absent on cache hits, which made no routing decision
+            if route and not cache_match:
+                notes.append(f"🧭 Routed to {route['model_name']} ({route['reason']})")
+                if analysis_result["model"] != route["model_name"]:
+                    notes.append(f"⚠️ {route['model_name']} did not answer in time; this analysis is from {analysis_result['model']}")
+
+            # ✅ Clean the SWOT Text and Extract Key Points in one Pass
+            swot = parse_response(analysis_result, structured=structured_output)
+
+        # ✅ Token tracking
+        if document_mode:
+            query_tokens, response_tokens, token_source = report.prompt_tokens, report.response_tokens, "all document chunks"
+        elif parallel_output:
+            query_tokens, response_tokens, token_source = report.prompt_tokens, report.response_tokens, "all four quadrant prompts"
         else:
-            st.write("- No Threats Identified")
-
-    # ✅ Token tracking
-    query_tokens = len(encoder.encode(company_details))
-    response_text = str(analysis_result)  # Convert AI response to plain text
-    response_tokens = len(encoder.encode(response_text))
-
-    st.sidebar.write(f"Total Tokens: {query_tokens + response_tokens}")
-    st.sidebar.write(f"Query Tokens: {query_tokens}")
-    st.sidebar.write(f"Response Tokens: {response_tokens}")
-
-    print(f"Tokens used: Query - {query_tokens}, Response - {response_tokens}")
+            query_tokens, response_tokens, token_source = token_usage(analysis_input, analysis_result, structured=structured_output)
+        cost = None
+        if not (document_mode or parallel_output or analysis_result.get("cache_match")) and analysis_result.get("model"):
+            cost = call_cost(analysis_result["model"], query_tokens, response_tokens)
+        print(f"Tokens used: Query - {query_tokens}, Response - {response_tokens}")
+
+        # ✅ Keep the Result in Session State so later Reruns Redraw it from Memory
+        st.session_state.analysis = {
+            "title": "📌 SWOT Analysis",
+            "swot": swot,
+            "mode": analysis_mode,
+            "notes": notes,
+            "sidebar_notes": sidebar_notes,
+            "tokens": (query_tokens, response_tokens, token_source),
+            "cost": cost,
+            "request_id": request_trace.request_id if request_trace is not None else None,
+        }
+        live_output.empty()
+        with tracing.span("render"):
+            render_analysis()
+
+        # ✅ Keep every Analysis in the History Store
+        with tracing.span("history_write"):
+            get_history_store().record(company_details, swot, analysis_mode, query_tokens, response_tokens)
+else:
+    render_analysis()
+    render_comparison()
+
+# ✅ Token Counts of the Analysis or Comparison on Screen
+analysis = st.session_state.get("analysis") or st.session_state.get("comparison")
+if analysis is not None:
+    for note in analysis["sidebar_notes"]:
+        st.sidebar.write(note)
+    if analysis["tokens"] is not None:
+        query_tokens, response_tokens, token_source = analysis["tokens"]
+        st.sidebar.write(f"Total Tokens: {query_tokens + response_tokens}")
+        st.sidebar.write(f"Query Tokens: {query_tokens}")
+        st.sidebar.write(f"Response Tokens: {response_tokens}")
+        st.sidebar.caption(f"Token counts from {token_source}")
+    if analysis["cost"] is not None:
+        st.sidebar.write(f"Estimated Cost: ${analysis['cost']:.5f}")
+    if analysis["request_id"] is not None:
+        st.sidebar.caption(f"Request ID: {analysis['request_id']}")
+
+# ✅ Latency and Cost per Model Route (model calls made by this process)
+st.sidebar.subheader("🧭 Model Routes")
+for route_name in ROUTES:
+    route_calls, route_seconds = metrics.ROUTE_SECONDS.totals(route=route_name)
+    if route_calls:
+        route_cost = metrics.ROUTE_COST.value(route=route_name)
+        st.sidebar.write(f"{route_name}: {route_calls} calls · {route_seconds / route_calls:.1f}s avg · ${route_cost:.4f}")
+
+# ✅ Paginated History Sidebar
+HISTORY_PAGE_SIZE = 10
+
+history = get_history_store()
+st.sidebar.subheader("🕘 History")
+history_filter = st.sidebar.text_input("Filter by company name")
+history_pages = max(1, -(-history.count(history_filter) // HISTORY_PAGE_SIZE))
+history_page = st.sidebar.number_input("Page", min_value=1, max_value=history_pages, value=1, step=1)
+for summary in history.page(history_page - 1, HISTORY_PAGE_SIZE, history_filter):
+    label = f"{summary.company} · {time.strftime('%Y-%m-%d %H:%M', time.localtime(summary.created_at))}"
+    st.sidebar.button(label, key=f"history_{summary.id}", on_click=select_history, args=(summary.id,))
+st.sidebar.caption(f"Page {history_page} of {history_pages}")
@@ -0,0 +1,216 @@
+"""Headless HTTP API for SWOT analysis (ASGI, built on Starlette).
+
+Run with:
+    uvicorn swot_api:app --host 0.0.0.0 --port 8000 --workers 2
+    python swot_api.py --port 8000
+
+Endpoints:
+    POST /analyze  {"company_details": "...", "structured": false, "mode": "single" | "quadrants", "deep": false}
+    POST /compare  {"companies": [{"name": "...", "company_details": "..."}, ...], "structured": false, "deep": false}
+    POST /parse    {"response": "<raw SWOT markdown>"}
+    GET  /health
+    GET  /metrics  (Prometheus text format)
+
+Requests are handled on the event loop with analyze_swot_async, so one worker
+serves many analyses at once. The model client, caches and rate limiter are the
+process-wide resources from swot_core, built once at startup and shared by
+every request.
+"""
+import argparse
+import asyncio
+import contextlib
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+import swot_metrics as metrics
+import swot_tracing as tracing
+from swot_budget import DEFAULT_PROMPT_TOKEN_BUDGET, plan_input
+from swot_compare import compare_companies_async
+from swot_core import MODEL_NAME, analyze_swot_async, parse_response, token_usage, warm_up
+from swot_history import get_history_store
+from swot_parser import parse_swot
+from swot_quadrants import quadrant_swot_async
+from swot_structured import StructuredOutputError
+
+MODES = ("single", "quadrants")
+MAX_COMPARE_COMPANIES = 10
+
+
+def swot_payload(swot):
+    """The four quadrant lists and the full markdown of a SWOTResult."""
+    strengths, weaknesses, opportunities, threats = swot.sections()
+    return {
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "opportunities": opportunities,
+        "threats": threats,
+        "swot_text": swot.text,
+    }
+
+
+def error_response(status_code, message):
+    return JSONResponse({"error": message}, status_code=status_code)
+
+
+async def _json_body(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+
+# ✅ Endpoints
+async def analyze(request):
+    with tracing.trace("api_analyze", request.headers.get("x-request-id")) as request_trace:
+        response = await _analyze(request)
+    if request_trace is not None:
+        response.headers["X-Request-ID"] = request_trace.request_id
+    return response
+
+
+async def _analyze(request):
+    body = await _json_body(request)
+    if body is None:
+        return error_response(400, "Request body must be a JSON object.")
+    details = body.get("company_details")
+    if not isinstance(details, str) or not details.strip():
+        return error_response(422, '"company_details" must be a non-empty string.')
+    structured = bool(body.get("structured", False))
+    deep = bool(body.get("deep", False))  # Always use the pro model instead of routing by input size
+    mode = body.get("mode", "single")
+    if mode not in MODES:
+        return error_response(422, f'"mode" must be one of {", ".join(MODES)}.')
+    if mode == "quadrants" and structured:
+        return error_response(422, 'The "quadrants" mode does not support structured output.')
+
+    # Token counting and SQLite writes run in worker threads so they never stall other requests
+    with tracing.span("input_prep"):
+        plan = await asyncio.to_thread(plan_input, details, DEFAULT_PROMPT_TOKEN_BUDGET, structured)
+    try:
+        if mode == "quadrants":
+            report = await quadrant_swot_async(plan.text, deep=deep)
+            swot, cache_match, model, route = report.result, None, None, None
+            usage = {"prompt_tokens": report.prompt_tokens, "response_tokens": report.response_tokens,
+                     "source": "all four quadrant prompts"}
+        else:
+            response = await analyze_swot_async(plan.text, structured, deep)
+            swot, cache_match = parse_response(response, structured), response.get("cache_match")
+            model, route = response.get("model", MODEL_NAME), response.get("route")
+            prompt_tokens, response_tokens, source = await asyncio.to_thread(token_usage, plan.text, response, structured)
+            usage = {"prompt_tokens": prompt_tokens, "response_tokens": response_tokens, "source": source}
+    except StructuredOutputError as error:
+        return error_response(502, f"The model returned malformed structured output: {error}")
+
+    history_mode = "structured" if structured else mode
+    with tracing.span("history_write"):
+        entry_id = await asyncio.to_thread(
+            get_history_store().record, details, swot, history_mode, usage["prompt_tokens"], usage["response_tokens"]
+        )
+
+    payload = swot_payload(swot)
+    payload.update(
+        token_usage=usage, cache_match=cache_match, model=model, route=route, condensed_from_tokens=plan.original_tokens,
+        history_id=entry_id, request_id=tracing.current_request_id(),
+    )
+    return JSONResponse(payload)
+
+
+async def compare(request):
+    with tracing.trace("api_compare", request.headers.get("x-request-id")) as request_trace:
+        response = await _compare(request)
+    if request_trace is not None:
+        response.headers["X-Request-ID"] = request_trace.request_id
+    return response
+
+
+def _record_companies(results):
+    for company in results:
+        if company.result is not None:
+            get_history_store().record(
+                company.details, company.result, "compare", company.prompt_tokens, company.response_tokens,
+                company=company.name,
+            )
+
+
+async def _compare(request):
+    body = await _json_body(request)
+    if body is None:
+        return error_response(400, "Request body must be a JSON object.")
+    companies = body.get("companies")
+    if not isinstance(companies, list) or not 2 <= len(companies) <= MAX_COMPARE_COMPANIES:
+        return error_response(422, f'"companies" must be a list of 2 to {MAX_COMPARE_COMPANIES} companies.')
+    pairs = []
+    for company in companies:
+        details = company.get("company_details") if isinstance(company, dict) else None
+        name = (company.get("name") or "") if isinstance(company, dict) else ""
+        if not isinstance(details, str) or not details.strip() or not isinstance(name, str):
+            return error_response(422, 'Each company needs a non-empty "company_details" string and an optional "name".')
+        pairs.append((name, details))
+
+    structured = bool(body.get("structured", False))
+    results = await compare_companies_async(pairs, structured, bool(body.get("deep", False)))
+    with tracing.span("history_write"):
+        await asyncio.to_thread(_record_companies, results)
+
+    payload = []
+    for company in results:
+        entry = {"name": company.name, "error": company.error}
+        if company.result is not None:
+            entry.update(swot_payload(company.result))
+            entry.update(
+                token_usage={"prompt_tokens": company.prompt_tokens, "response_tokens": company.response_tokens},
+                cache_match=company.cache_match,
+            )
+        payload.append(entry)
+    return JSONResponse({"companies": payload, "request_id": tracing.current_request_id()})
+
+
+async def parse(request):
+    body = await _json_body(request)
+    if body is None or not isinstance(body.get("response"), str):
+        return error_response(422, '"response" must be a string with the raw SWOT text.')
+    return JSONResponse(swot_payload(parse_swot(body["response"])))
+
+
+async def health(request):
+    return JSONResponse({"status": "ok"})
+
+
+async def metrics_endpoint(request):
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    warm_up()  # Fails startup early when the API key is missing
+    yield
+
+
+app = Starlette(
+    routes=[
+        Route("/analyze", analyze, methods=["POST"]),
+        Route("/compare", compare, methods=["POST"]),
+        Route("/parse", parse, methods=["POST"]),
+        Route("/health", health, methods=["GET"]),
+        Route("/metrics", metrics_endpoint, methods=["GET"]),
+    ],
+    lifespan=lifespan,
+)
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the SWOT analysis HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes, each with its own model client")
+    args = parser.parse_args(argv)
+    uvicorn.run("swot_api:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
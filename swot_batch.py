@@ -0,0 +1,127 @@
+"""Runs SWOT analysis over a CSV or JSONL file of companies from the command line.
+
+Usage:
+    python swot_batch.py companies.csv results.jsonl --concurrency 8
+
+Each input row needs an id column (default "name") and a text column (default
+"details"). Results are appended to the output JSONL as soon as each company
+finishes; rerunning with the same output file skips companies already written,
+so an interrupted run resumes where it stopped.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+
+from swot_budget import DEFAULT_PROMPT_TOKEN_BUDGET, plan_input
+from swot_core import analyze_swot_async, get_chain, parse_response
+
+
+# ✅ Input Readers
+def read_companies(path, id_column="name", text_column="details"):
+    """Yields (company_id, company_details) pairs from a .csv or .jsonl file."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            rows = (json.loads(line) for line in handle if line.strip())
+        else:
+            rows = csv.DictReader(handle)
+        for index, row in enumerate(rows):
+            company_id = str(row.get(id_column) or index)
+            yield company_id, row.get(text_column) or ""
+
+
+def read_checkpoint(path):
+    """Returns the ids already written to the output file."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                done.add(json.loads(line)["id"])
+            except (ValueError, KeyError):
+                continue  # A partially written last line from an interrupted run
+    return done
+
+
+def build_record(company_id, response, structured=False):
+    """Turns a model response into the row written to the output file."""
+    swot = parse_response(response, structured)
+    strengths, weaknesses, opportunities, threats = swot.key_points(3)
+    return {
+        "id": company_id,
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "opportunities": opportunities,
+        "threats": threats,
+        "swot_text": swot.text,
+        "usage_metadata": response.get("usage_metadata"),
+        "model": response.get("model"),
+    }
+
+
+# ✅ Bounded Concurrent Runner
+async def run_batch(companies, output_path, concurrency=4, structured=False, budget=DEFAULT_PROMPT_TOKEN_BUDGET,
+                    deep=False):
+    """Analyzes companies with at most `concurrency` model calls in flight."""
+    done = read_checkpoint(output_path)
+    pending = [(company_id, details) for company_id, details in companies if company_id not in done]
+    print(f"{len(done)} already done, {len(pending)} to analyze", file=sys.stderr)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    with open(output_path, "a", encoding="utf-8") as output:
+
+        async def analyze_one(company_id, details):
+            nonlocal failures
+            async with semaphore:
+                try:
+                    plan = plan_input(details, budget, structured)
+                    response = await analyze_swot_async(plan.text, structured, deep)
+                    record = build_record(company_id, response, structured)
+                except Exception as error:  # Keep going; failed rows are retried on the next run
+                    failures += 1
+                    print(f"[{company_id}] failed: {error}", file=sys.stderr)
+                    return
+            record["condensed_from_tokens"] = plan.original_tokens
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+        await asyncio.gather(*(analyze_one(company_id, details) for company_id, details in pending))
+
+    return len(pending) - failures, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch SWOT analysis over a CSV/JSONL file of companies.")
+    parser.add_argument("input", help="Input .csv or .jsonl file")
+    parser.add_argument("output", help="Output .jsonl file (also used as the resume checkpoint)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum model calls in flight")
+    parser.add_argument("--id-column", default="name")
+    parser.add_argument("--text-column", default="details")
+    parser.add_argument("--structured", action="store_true", help="Ask the model for schema-constrained JSON")
+    parser.add_argument("--deep", action="store_true", help="Use the pro model for every company, whatever its length")
+    parser.add_argument("--token-budget", type=int, default=DEFAULT_PROMPT_TOKEN_BUDGET,
+                        help="Condense inputs whose prompt exceeds this many tokens (0 disables)")
+    args = parser.parse_args(argv)
+
+    try:
+        get_chain(args.structured)
+    except RuntimeError as error:
+        parser.error(str(error))
+
+    start = time.perf_counter()
+    companies = read_companies(args.input, args.id_column, args.text_column)
+    succeeded, failed = asyncio.run(run_batch(
+        companies, args.output, args.concurrency, args.structured, args.token_budget, args.deep
+    ))
+    print(f"Done: {succeeded} analyzed, {failed} failed in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
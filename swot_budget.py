@@ -0,0 +1,74 @@
+import os
+import re
+from collections import Counter, namedtuple
+
+from swot_core import count_tokens, prompt_template_tokens
+
+# ✅ Prompt Budget Settings
+DEFAULT_PROMPT_TOKEN_BUDGET = int(os.getenv("SWOT_PROMPT_TOKEN_BUDGET", "8000"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+_WORD = re.compile(r"[a-z][a-z'-]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be been but by for from has have in into is it its of on or that the their "
+    "there these this those to was were which while will with within we our they he she you your".split()
+)
+
+# prompt_tokens is what will actually be sent; original_tokens is set only when the input was condensed
+BudgetDecision = namedtuple("BudgetDecision", ["text", "prompt_tokens", "budget", "original_tokens"])
+
+
+def split_sentences(text):
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+def condense_text(text, target_tokens, total_tokens=None):
+    """Extractive summary: keeps the most informative sentences, in their original order.
+
+    Sentences are scored by the average document frequency of their content words,
+    with a small bonus for the opening sentences, and picked best-first until the
+    estimated token count reaches target_tokens.
+    """
+    sentences = split_sentences(text)
+    if not sentences:
+        return text
+    total_tokens = total_tokens or count_tokens(text)
+    tokens_per_char = total_tokens / max(len(text), 1)
+
+    sentence_words = [[word for word in _WORD.findall(sentence.lower()) if word not in _STOPWORDS] for sentence in sentences]
+    frequencies = Counter(word for words in sentence_words for word in words)
+
+    def score(index):
+        words = sentence_words[index]
+        lead_bonus = 1.0 if index < 3 else 0.0
+        return sum(frequencies[word] for word in words) / (len(words) + 1) + lead_bonus
+
+    chosen, used = [], 0.0
+    for index in sorted(range(len(sentences)), key=score, reverse=True):
+        cost = (len(sentences[index]) + 1) * tokens_per_char  # Counts the joining space
+        if used + cost > target_tokens:
+            continue
+        chosen.append(index)
+        used += cost
+    if not chosen:  # Even the best sentence is too long; keep its head
+        return sentences[0][: int(target_tokens / tokens_per_char)]
+    return " ".join(sentences[index] for index in sorted(chosen))
+
+
+def plan_input(input_text, budget=DEFAULT_PROMPT_TOKEN_BUDGET, structured=False):
+    """Counts the prompt before the model call and condenses the input when it is over budget."""
+    template_tokens = prompt_template_tokens(structured)
+    input_tokens = count_tokens(input_text)
+    prompt_tokens = template_tokens + input_tokens
+    if budget <= 0 or prompt_tokens <= budget:
+        return BudgetDecision(input_text, prompt_tokens, budget, None)
+
+    goal = target = max(budget - template_tokens, 1)
+    condensed = condense_text(input_text, target, input_tokens)
+    condensed_tokens = count_tokens(condensed)
+    # Per-sentence costs are estimates, so aim lower if the exact count is still over
+    while condensed_tokens > goal and condensed:
+        target *= 0.95 * goal / condensed_tokens
+        condensed = condense_text(input_text, target, input_tokens)
+        condensed_tokens = count_tokens(condensed)
+    return BudgetDecision(condensed, template_tokens + condensed_tokens, budget, prompt_tokens)
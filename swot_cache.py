@@ -0,0 +1,225 @@
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# ✅ Cache Settings (override with environment variables)
+DEFAULT_CACHE_PATH = os.getenv(
+    "SWOT_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "swot_analysis", "responses.sqlite3"),
+)
+DEFAULT_MAX_ENTRIES = int(os.getenv("SWOT_CACHE_MAX_ENTRIES", "1000"))
+DEFAULT_TTL_SECONDS = float(os.getenv("SWOT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def normalize_input(input_text):
+    """Collapses whitespace so trivially different pastes share a cache entry."""
+    return " ".join((input_text or "").split())
+
+
+def cache_key(input_text, prompt_text, model_name, temperature):
+    """Builds a content-addressed key from everything that affects the model output."""
+    payload = json.dumps(
+        {
+            "input": normalize_input(input_text),
+            "prompt": prompt_text,
+            "model": model_name,
+            "temperature": temperature,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Disk-backed LRU cache with a TTL, shared by every session and process on the host."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        """Returns the cached value for key, or None when missing or expired."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+
+    def set(self, key, value):
+        """Stores a JSON-serializable value and evicts the least recently used overflow."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            if self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        """Removes every cached response."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+# ✅ Near-Duplicate Detection for Company Descriptions
+DEFAULT_SIMILARITY_THRESHOLD = float(os.getenv("SWOT_SIMILARITY_THRESHOLD", "0.8"))  # Above 1 disables it
+DEFAULT_SIMILARITY_ENTRIES = int(os.getenv("SWOT_SIMILARITY_MAX_ENTRIES", "5000"))
+
+
+def _shingles(input_text):
+    """Lowercase words plus adjacent word pairs, so reordered sentences stay similar."""
+    words = normalize_input(input_text).lower().split()
+    shingles = set(words)
+    shingles.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return shingles
+
+
+def proper_names(input_text):
+    """Capitalized words (company, product and place names), which a near-duplicate must share exactly.
+
+    Templated descriptions of different companies differ only in a name or two and
+    score well above the threshold on shingles alone.
+    """
+    words = (word.strip(".,;:!?()[]\"'") for word in normalize_input(input_text).split())
+    return frozenset(word.lower() for word in words if word[:1].isupper())
+
+
+def minhash_signature(input_text, num_bins=128):
+    """One-permutation MinHash: each shingle is hashed once and kept as the minimum of its bin.
+
+    The fraction of matching bins between two signatures estimates the Jaccard
+    similarity of their shingle sets. Python's per-process hash() is fine here
+    because the index only lives in memory.
+    """
+    signature = [None] * num_bins
+    for shingle in _shingles(input_text):
+        value = hash(shingle) & 0xFFFFFFFFFFFFFFFF
+        index = value % num_bins
+        if signature[index] is None or value < signature[index]:
+            signature[index] = value
+    return tuple(signature)
+
+
+def signature_similarity(first, second):
+    """Estimated Jaccard similarity, ignoring bins that are empty in both signatures."""
+    matches = used = 0
+    for a, b in zip(first, second):
+        if a is None and b is None:
+            continue
+        used += 1
+        matches += a == b
+    return matches / used if used else 0.0
+
+
+class SimilarityCache:
+    """In-memory MinHash/LSH index from company descriptions to response cache keys.
+
+    Signatures are split into bands; descriptions sharing any band become candidates
+    and are then scored on the full signature, so lookups stay sub-linear in the
+    number of indexed descriptions. Candidates naming different companies (see
+    proper_names) never match, however similar the rest of the text is.
+    """
+
+    def __init__(self, threshold=DEFAULT_SIMILARITY_THRESHOLD, max_entries=DEFAULT_SIMILARITY_ENTRIES,
+                 num_bins=128, bands=32):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.num_bins = num_bins
+        self.rows = num_bins // bands
+        self._entries = collections.OrderedDict()  # key -> (signature, proper names), oldest first
+        self._buckets = collections.defaultdict(set)  # (band, band values) -> keys
+        self._lock = threading.Lock()
+
+    def _band_keys(self, signature):
+        bands = ((start, signature[start:start + self.rows]) for start in range(0, self.num_bins, self.rows))
+        return [band for band in bands if any(value is not None for value in band[1])]
+
+    def add(self, input_text, key):
+        """Indexes input_text as producing the cached response stored under key."""
+        if self.threshold > 1:
+            return
+        signature = minhash_signature(input_text, self.num_bins)
+        names = proper_names(input_text)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (signature, names)
+            for band_key in self._band_keys(signature):
+                self._buckets[band_key].add(key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def lookup(self, input_text):
+        """Returns (key, score) for the most similar indexed description above the threshold."""
+        if self.threshold > 1:
+            return None
+        signature = minhash_signature(input_text, self.num_bins)
+        names = proper_names(input_text)
+        with self._lock:
+            candidates = set()
+            for band_key in self._band_keys(signature):
+                candidates.update(self._buckets.get(band_key, ()))
+            best = None
+            for key in candidates:
+                candidate_signature, candidate_names = self._entries[key]
+                if candidate_names != names:
+                    continue
+                score = signature_similarity(signature, candidate_signature)
+                if score >= self.threshold and (best is None or score > best[1]):
+                    best = (key, score)
+        return best
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band_key in self._band_keys(entry[0]):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
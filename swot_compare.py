@@ -0,0 +1,49 @@
+import asyncio
+from collections import namedtuple
+
+import swot_tracing as tracing
+from swot_budget import DEFAULT_PROMPT_TOKEN_BUDGET, plan_input
+from swot_core import analyze_swot_async, parse_response, token_usage
+from swot_history import guess_company_name
+
+# result is None and error holds the message when that company's analysis failed
+CompanyResult = namedtuple(
+    "CompanyResult", ["name", "details", "result", "error", "cache_match", "prompt_tokens", "response_tokens"]
+)
+
+
+def company_names(companies):
+    """(name, details) pairs, guessing a name from the description where none was given."""
+    return [(name.strip() or guess_company_name(details), details) for name, details in companies]
+
+
+async def compare_companies_async(companies, structured=False, deep=False, budget=DEFAULT_PROMPT_TOKEN_BUDGET,
+                                  on_company=None):
+    """Analyzes every (name, details) pair concurrently and returns one CompanyResult each, in input order.
+
+    All calls share the process-wide rate limiter, cache and in-flight coalescing,
+    so a company analyzed before is reused rather than regenerated. A failed
+    company is reported in its CompanyResult instead of failing the comparison.
+    on_company(index, company_result) is called as each company finishes.
+    """
+    companies = company_names(companies)
+    results = [None] * len(companies)
+
+    async def analyze_company(index, name, details):
+        with tracing.span(f"company:{index}", company=name):
+            try:
+                plan = await asyncio.to_thread(plan_input, details, budget, structured)  # Token counting off the loop
+                response = await analyze_swot_async(plan.text, structured, deep)
+                swot = parse_response(response, structured)
+            except Exception as error:
+                results[index] = CompanyResult(name, details, None, str(error), None, 0, 0)
+            else:
+                prompt_tokens, response_tokens, _ = await asyncio.to_thread(token_usage, plan.text, response, structured)
+                results[index] = CompanyResult(
+                    name, details, swot, None, response.get("cache_match"), prompt_tokens, response_tokens
+                )
+        if on_company is not None:
+            on_company(index, results[index])
+
+    await asyncio.gather(*(analyze_company(index, name, details) for index, (name, details) in enumerate(companies)))
+    return results
@@ -0,0 +1,641 @@
+import asyncio
+import contextlib
+import functools
+import os
+import threading
+import time
+
+import swot_metrics as metrics
+import swot_resilience as resilience
+import swot_routing as routing
+import swot_tracing as tracing
+from swot_cache import ResponseCache, SimilarityCache, cache_key
+from swot_parser import SECTIONS, parse_swot, response_text
+from swot_ratelimit import EXPECTED_RESPONSE_TOKENS, RateLimiter, estimate_tokens
+from swot_singleflight import SingleFlight
+from swot_structured import SWOT_JSON_SCHEMA, StructuredOutputError, parse_structured_swot, swot_json_prompt
+
+# ✅ Model Settings
+LLM_BACKEND = os.getenv("SWOT_LLM_BACKEND", "gemini")  # "gemini" or "fake" (offline, see swot_fake_llm.py)
+MODEL_NAME = "gemini-1.5-pro-latest"  # The pro route; swot_routing picks a faster model for short inputs
+FALLBACK_MODEL_NAME = os.getenv("SWOT_FALLBACK_MODEL", "gemini-1.5-flash-latest")  # Empty disables the fallback
+TEMPERATURE = 0.7
+
+# ✅ Define the AI Prompt for SWOT Analysis
+swot_prompt = """
+You are an expert business consultant. Given the company information below, provide a **detailed** SWOT Analysis in **structured format only**.
+
+### Strengths  
+(Provide at least 3-5 specific strengths related to the company)  
+
+### Weaknesses  
+(Provide at least 3-5 specific weaknesses)  
+
+### Opportunities  
+(Provide at least 3-5 external opportunities the company can leverage)  
+
+### Threats  
+(Provide at least 3-5 threats, including competitors, market risks, etc.)  
+
+**ONLY return the SWOT analysis without additional explanations.**  
+
+Company Details:  
+{context}
+"""
+
+# ✅ Single-Section Prompts for the Parallel Quadrant Mode
+swot_quadrant_prompt = """
+You are an expert business consultant. Given the company information below, provide ONLY the **{section}** section of a **detailed** SWOT Analysis in **structured format only**.
+
+### {section}  
+({guidance})  
+
+**ONLY return this section without additional explanations.**  
+
+Company Details:  
+{{context}}
+"""
+
+QUADRANT_GUIDANCE = {
+    "Strengths": "Provide at least 3-5 specific strengths related to the company",
+    "Weaknesses": "Provide at least 3-5 specific weaknesses",
+    "Opportunities": "Provide at least 3-5 external opportunities the company can leverage",
+    "Threats": "Provide at least 3-5 threats, including competitors, market risks, etc.",
+}
+
+
+def quadrant_prompt(section):
+    return swot_quadrant_prompt.format(section=section, guidance=QUADRANT_GUIDANCE[section])
+
+
+# ✅ Process-wide Resource Registry
+# Streamlit re-executes the app script on every interaction, but imported modules
+# stay loaded, so resources registered here are built once per process.
+_resources = {}
+_resources_lock = threading.RLock()
+
+
+def get_resource(name, factory):
+    """Returns the named resource, building it with factory() on first use."""
+    try:
+        return _resources[name]
+    except KeyError:
+        pass
+    with _resources_lock:
+        if name not in _resources:
+            _resources[name] = factory()
+        return _resources[name]
+
+
+def clear_resources():
+    """Drops every registered resource so the next lookup rebuilds it."""
+    with _resources_lock:
+        _resources.clear()
+
+
+def get_api_key():
+    """Reads the Gemini API key, failing loudly when it is not configured."""
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise RuntimeError("API Key is missing. Set GOOGLE_API_KEY in your environment.")
+    return api_key
+
+
+def _build_ai_model(model_name=MODEL_NAME):
+    if LLM_BACKEND == "fake":
+        from swot_fake_llm import FakeSWOTChatModel
+
+        return FakeSWOTChatModel.from_env(model_name=f"fake-{model_name}")
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    # swot_resilience owns retries and timeouts; max_retries=1 turns the SDK's own retries off
+    return ChatGoogleGenerativeAI(
+        model=model_name, google_api_key=get_api_key(), temperature=TEMPERATURE, max_retries=1,
+        timeout=resilience.DEFAULT_TIMEOUT_SECONDS or None,
+    )
+
+
+def _build_prompt_template():
+    from langchain_core.prompts import PromptTemplate
+
+    return PromptTemplate(input_variables=["context"], template=swot_prompt)
+
+
+def _build_structured_chain(model_name=MODEL_NAME):
+    from langchain_core.prompts import PromptTemplate
+
+    prompt_template = PromptTemplate(input_variables=["context"], template=swot_json_prompt)
+    json_model = get_ai_model(model_name).bind(response_mime_type="application/json", response_schema=SWOT_JSON_SCHEMA)
+    return prompt_template | json_model
+
+
+def _build_encoder():
+    import tiktoken
+
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as error:  # The vocabulary is downloaded on first use and may be unreachable
+        print(f"Tokenizer unavailable, estimating token counts instead: {error.__class__.__name__}")
+        return None
+
+
+def _resource_name(name, model_name):
+    return name if model_name == MODEL_NAME else f"{name}:{model_name}"
+
+
+def get_ai_model(model_name=MODEL_NAME):
+    return get_resource(_resource_name("ai_model", model_name), lambda: _build_ai_model(model_name))
+
+
+def get_prompt_template():
+    return get_resource("prompt_template", _build_prompt_template)
+
+
+def get_swot_chain(model_name=MODEL_NAME):
+    return get_resource(_resource_name("swot_chain", model_name), lambda: get_prompt_template() | get_ai_model(model_name))
+
+
+def get_structured_chain(model_name=MODEL_NAME):
+    return get_resource(_resource_name("structured_chain", model_name), lambda: _build_structured_chain(model_name))
+
+
+def get_quadrant_chain(section, model_name=MODEL_NAME):
+    def build():
+        from langchain_core.prompts import PromptTemplate
+
+        return PromptTemplate(input_variables=["context"], template=quadrant_prompt(section)) | get_ai_model(model_name)
+
+    return get_resource(_resource_name(f"quadrant_chain:{section}", model_name), build)
+
+
+def get_chain(structured=False, model_name=MODEL_NAME):
+    return get_structured_chain(model_name) if structured else get_swot_chain(model_name)
+
+
+def get_encoder():
+    return get_resource("encoder", _build_encoder)
+
+
+def get_response_cache():
+    return get_resource("response_cache", ResponseCache)
+
+
+def get_similarity_cache(structured=False, model_name=MODEL_NAME):
+    name = "similarity_cache:json" if structured else "similarity_cache"
+    return get_resource(_resource_name(name, model_name), SimilarityCache)
+
+
+def get_rate_limiter():
+    return get_resource("rate_limiter", RateLimiter)
+
+
+def get_single_flight():
+    return get_resource("single_flight", SingleFlight)
+
+
+def get_resilience_policy():
+    return get_resource("resilience_policy", resilience.ResiliencePolicy)
+
+
+metrics.Gauge(
+    "swot_coalesced_calls", "Calls answered by another in-flight call for the same input.",
+    lambda: get_single_flight().collapsed,
+)
+for _event, _documentation in (
+    ("retries", "Model calls retried after a transient error."),
+    ("hedges", "Hedged second requests started after the hedge delay."),
+    ("hedge_wins", "Hedged requests that answered before the original."),
+    ("timeouts", "Model calls that hit the timeout."),
+    ("fallbacks", "Calls answered by the fallback model."),
+):
+    metrics.Gauge(f"swot_model_{_event}", _documentation, lambda event=_event: get_resilience_policy().stats[event])
+metrics.Gauge(
+    "swot_queue_wait_estimate_seconds", "Seconds a new call would wait on the rate limiter right now.",
+    lambda: get_rate_limiter().current_wait(),
+)
+
+
+def warm_up():
+    """Builds every shared resource up front so the first request pays no setup cost."""
+    get_swot_chain()
+    get_swot_chain(routing.FAST_MODEL_NAME)
+    get_encoder()
+    get_response_cache()
+    get_rate_limiter()
+    get_single_flight()
+
+
+def _message_text(message):
+    content = message.content
+    return content if isinstance(content, str) else "".join(str(part) for part in content)
+
+
+def _response_from_message(message):
+    return {"content": _message_text(message), "usage_metadata": getattr(message, "usage_metadata", None)}
+
+
+def _prompt_text(structured):
+    return swot_json_prompt if structured else swot_prompt
+
+
+def _cache_model_name(model_name=MODEL_NAME):
+    return model_name if LLM_BACKEND == "gemini" else f"{LLM_BACKEND}:{model_name}"
+
+
+def swot_cache_key(input_text, structured=False, model_name=MODEL_NAME):
+    return cache_key(input_text, _prompt_text(structured), _cache_model_name(model_name), TEMPERATURE)
+
+
+def _reserved_tokens(input_text, structured=False):
+    return estimate_tokens(_prompt_text(structured)) + estimate_tokens(input_text) + EXPECTED_RESPONSE_TOKENS
+
+
+def _settle_rate_limit(reserved_tokens, response):
+    usage = response.get("usage_metadata") or {}
+    get_rate_limiter().settle(reserved_tokens, usage.get("total_tokens"))
+    metrics.record_usage(usage)
+
+
+def _mode(structured):
+    return "structured" if structured else "text"
+
+
+@contextlib.contextmanager
+def _model_call(mode, model_name=MODEL_NAME):
+    """Times a model call for the metrics and counts it as an error when it raises."""
+    try:
+        with tracing.span("model_call", mode=mode, model=model_name), metrics.MODEL_CALL_SECONDS.time(mode=mode):
+            yield
+    except Exception:
+        metrics.ERRORS.inc(stage="model_call")
+        raise
+
+
+def _acquire(reserved_tokens, mode):
+    """Waits for a rate limit slot and returns the seconds spent queueing."""
+    with tracing.span("queue_wait", reserved_tokens=reserved_tokens):
+        waited = get_rate_limiter().acquire(reserved_tokens)
+        metrics.QUEUE_WAIT_SECONDS.observe(waited, mode=mode)
+    return waited
+
+
+def _try_acquire(reserved_tokens):
+    """Takes a rate limit slot only if one is free now; hedged requests never queue."""
+    return get_rate_limiter().try_acquire(reserved_tokens)
+
+
+async def _acquire_async(reserved_tokens, mode):
+    with tracing.span("queue_wait", reserved_tokens=reserved_tokens):
+        waited = await get_rate_limiter().acquire_async(reserved_tokens)
+        metrics.QUEUE_WAIT_SECONDS.observe(waited, mode=mode)
+    return waited
+
+
+def _format_prompt(chain, input_text):
+    """Runs the prompt step of a prompt | model chain on its own so it can be traced."""
+    with tracing.span("prompt_format"):
+        return chain.first.invoke({"context": input_text})
+
+
+# ✅ Model Routing
+def route_for(input_text, deep=False):
+    """Picks the model for an input by its token count (see swot_routing)."""
+    with tracing.span("routing") as span:
+        route = routing.choose_route(count_tokens(input_text), MODEL_NAME, deep)
+        span.update(route=route.name, model=route.model_name, reason=route.reason)
+    return route
+
+
+def _fallback_model(route):
+    return FALLBACK_MODEL_NAME if FALLBACK_MODEL_NAME and FALLBACK_MODEL_NAME != route.model_name else None
+
+
+def _record_route(route, response, prompt_text, seconds):
+    """Adds a finished call to the per-route latency and cost metrics."""
+    usage = response.get("usage_metadata") or {}
+    prompt_tokens = usage.get("input_tokens")
+    response_tokens = usage.get("output_tokens")
+    if prompt_tokens is None or response_tokens is None:
+        prompt_tokens, response_tokens = count_tokens(prompt_text), count_tokens(response["content"])
+    metrics.ROUTE_SECONDS.observe(seconds, route=route.name)
+    metrics.ROUTE_COST.inc(routing.call_cost(response["model"], prompt_tokens, response_tokens), route=route.name)
+
+
+def _finish_response(message, model_name, route, reserved_tokens, prompt, seconds):
+    response = _response_from_message(message)
+    response["model"], response["route"] = model_name, route._asdict()
+    _settle_rate_limit(reserved_tokens, response)
+    _record_route(route, response, prompt.to_string(), seconds)
+    return response
+
+
+def _call_model(chain_for, input_text, reserved_tokens, mode, route):
+    """Formats the prompt and calls the route's model with retries, hedging and fallback (see swot_resilience).
+
+    chain_for(model_name) returns the prompt | model chain for a model. The response
+    records which model answered under "model" and the chosen route under "route".
+    """
+    prompt = _format_prompt(chain_for(route.model_name), input_text)
+    started, queue_seconds = time.perf_counter(), []  # Route latency excludes time spent in the rate limit queue
+
+    def acquire():
+        queue_seconds.append(_acquire(reserved_tokens, mode))
+
+    def attempt(model_name=route.model_name):
+        with _model_call(mode, model_name):
+            return chain_for(model_name).last.invoke(prompt)
+
+    def fallback():
+        acquire()
+        return attempt(fallback_model)
+
+    fallback_model = _fallback_model(route)
+    message, used_fallback = resilience.call_resilient_sync(
+        get_resilience_policy(), attempt, fallback if fallback_model else None,
+        acquire=acquire, can_hedge=lambda: _try_acquire(reserved_tokens),
+    )
+    model_name = fallback_model if used_fallback else route.model_name
+    seconds = time.perf_counter() - started - sum(queue_seconds)
+    return _finish_response(message, model_name, route, reserved_tokens, prompt, seconds)
+
+
+async def _call_model_async(chain_for, input_text, reserved_tokens, mode, route):
+    """Async variant of _call_model; a losing hedged request is cancelled."""
+    prompt = _format_prompt(chain_for(route.model_name), input_text)
+    started, queue_seconds = time.perf_counter(), []
+
+    async def acquire():
+        queue_seconds.append(await _acquire_async(reserved_tokens, mode))
+
+    async def attempt(model_name=route.model_name):
+        with _model_call(mode, model_name):
+            return await chain_for(model_name).last.ainvoke(prompt)
+
+    async def fallback():
+        await acquire()
+        return await attempt(fallback_model)
+
+    fallback_model = _fallback_model(route)
+    message, used_fallback = await resilience.call_resilient(
+        get_resilience_policy(), attempt, fallback if fallback_model else None,
+        acquire=acquire, can_hedge=lambda: _try_acquire(reserved_tokens),
+    )
+    model_name = fallback_model if used_fallback else route.model_name
+    seconds = time.perf_counter() - started - sum(queue_seconds)
+    # Local token counting (when the provider reports no usage) is CPU work; keep it off the event loop
+    return await asyncio.to_thread(_finish_response, message, model_name, route, reserved_tokens, prompt, seconds)
+
+
+def _cache_hit(cached, kind, score):
+    """Marks a cached response as reused; its "route" described the request that generated it, not this one."""
+    cached.pop("route", None)
+    cached["cache_match"] = {"kind": kind, "score": score}
+    metrics.CACHE_LOOKUPS.inc(result=kind)
+    return cached
+
+
+def _cached_response(input_text, key, structured, model_name=MODEL_NAME):
+    """Looks up an exact cache hit, then a near-duplicate description for the same model; None on a miss."""
+    response_cache = get_response_cache()
+    cached = response_cache.get(key)
+    if cached is not None:
+        get_similarity_cache(structured, model_name).add(input_text, key)  # Re-index entries cached by earlier processes
+        return _cache_hit(cached, "exact", 1.0)
+
+    match = get_similarity_cache(structured, model_name).lookup(input_text)
+    if match is not None:
+        similar_key, score = match
+        cached = response_cache.get(similar_key)
+        if cached is not None:
+            return _cache_hit(cached, "similar", round(score, 3))
+    metrics.CACHE_LOOKUPS.inc(result="miss")
+    return None
+
+
+def _store(input_text, key, response, structured, model_name=MODEL_NAME):
+    if structured:
+        try:
+            parse_structured_swot(response["content"])  # Never cache or serve malformed JSON, fallback answers included
+        except StructuredOutputError:
+            metrics.ERRORS.inc(stage="parse")
+            raise
+    if response["model"] != model_name:
+        return  # Fallback answers are served but not cached, so the next request tries the primary model again
+    get_response_cache().set(key, response)
+    get_similarity_cache(structured, model_name).add(input_text, key)
+
+
+# ✅ Function to Generate SWOT
+def analyze_swot(input_text, structured=False, deep=False):
+    """Returns the SWOT response, reusing a cached answer for identical or near-identical inputs.
+
+    The model is picked by route_for: short inputs go to the fast model unless
+    deep=True. With structured=True the model is asked for a schema-constrained
+    JSON object and a malformed reply raises StructuredOutputError instead of being
+    cached. Cached responses carry a "cache_match" entry with the match kind and
+    similarity score. Callers that miss the cache while the same input is already
+    being analyzed wait for that call and receive its response.
+    """
+    route = route_for(input_text, deep)
+    key = swot_cache_key(input_text, structured, route.model_name)
+    with tracing.span("cache_lookup") as span:
+        cached = _cached_response(input_text, key, structured, route.model_name)
+        span["hit"] = cached is not None
+    if cached is not None:
+        return cached
+    # Concurrent misses for the same key share one model call
+    return get_single_flight().do(key, lambda: _generate(input_text, key, structured, route))
+
+
+def _generate(input_text, key, structured, route):
+    reserved_tokens = _reserved_tokens(input_text, structured)
+    chain_for = functools.partial(get_chain, structured)
+    response = _call_model(chain_for, input_text, reserved_tokens, _mode(structured), route)
+    _store(input_text, key, response, structured, route.model_name)
+    return response
+
+
+async def analyze_swot_async(input_text, structured=False, deep=False):
+    """Async variant of analyze_swot for concurrent callers such as the batch runner.
+
+    Token counting and SQLite cache access run in worker threads so a slow disk or
+    a busy cache lock never stalls the event loop.
+    """
+    route = await asyncio.to_thread(route_for, input_text, deep)
+    key = swot_cache_key(input_text, structured, route.model_name)
+    with tracing.span("cache_lookup") as span:
+        cached = await asyncio.to_thread(_cached_response, input_text, key, structured, route.model_name)
+        span["hit"] = cached is not None
+    if cached is not None:
+        return cached
+    return await get_single_flight().do_async(key, lambda: _generate_async(input_text, key, structured, route))
+
+
+async def _generate_async(input_text, key, structured, route):
+    reserved_tokens = _reserved_tokens(input_text, structured)
+    chain_for = functools.partial(get_chain, structured)
+    response = await _call_model_async(chain_for, input_text, reserved_tokens, _mode(structured), route)
+    await asyncio.to_thread(_store, input_text, key, response, structured, route.model_name)
+    return response
+
+
+async def analyze_quadrant_async(input_text, section, deep=False):
+    """Generates one SWOT section on its own prompt; routed, cached, coalesced and rate limited like analyze_swot."""
+    prompt_text = quadrant_prompt(section)
+    route = await asyncio.to_thread(route_for, input_text, deep)
+    key = cache_key(input_text, prompt_text, _cache_model_name(route.model_name), TEMPERATURE)
+    cached = await asyncio.to_thread(get_response_cache().get, key)
+    if cached is not None:
+        return _cache_hit(cached, "exact", 1.0)
+    metrics.CACHE_LOOKUPS.inc(result="miss")
+
+    async def generate():
+        reserved_tokens = (
+            estimate_tokens(prompt_text) + estimate_tokens(input_text) + EXPECTED_RESPONSE_TOKENS // len(SECTIONS)
+        )
+        chain_for = functools.partial(get_quadrant_chain, section)
+        response = await _call_model_async(chain_for, input_text, reserved_tokens, "quadrant", route)
+        if response["model"] == route.model_name:
+            await asyncio.to_thread(get_response_cache().set, key, response)
+        return response
+
+    return await get_single_flight().do_async(key, generate)
+
+
+def parse_response(response, structured=False):
+    """Turns a response from analyze_swot into a SWOTResult."""
+    with tracing.span("parse", mode=_mode(structured)), metrics.PARSE_SECONDS.time(mode=_mode(structured)):
+        if not structured:
+            return parse_swot(response)
+        try:
+            return parse_structured_swot(response["content"])
+        except StructuredOutputError:
+            metrics.ERRORS.inc(stage="parse")
+            raise
+
+
+# ✅ Streaming SWOT Generation
+class SWOTStream:
+    """Yields SWOT text chunks as they arrive; .response holds the full response once exhausted.
+
+    When the same input is already streaming for another caller, this waits for that
+    call and yields its full text at once (.coalesced is then True).
+    """
+
+    def __init__(self, input_text, deep=False):
+        self.input_text = input_text
+        self.deep = deep
+        self.route = None
+        self.response = None
+        self.cached = False
+        self.coalesced = False
+
+    def __iter__(self):
+        self.route = route_for(self.input_text, self.deep)
+        key = swot_cache_key(self.input_text, model_name=self.route.model_name)
+        with tracing.span("cache_lookup") as span:
+            cached = _cached_response(self.input_text, key, False, self.route.model_name)
+            span["hit"] = cached is not None
+        if cached is not None:
+            self.response, self.cached = cached, True
+            yield cached["content"]
+            return
+
+        single_flight = get_single_flight()
+        future, is_leader = single_flight.begin(key)
+        if not is_leader:
+            self.response, self.coalesced = future.result(), True
+            yield self.response["content"]
+            return
+        try:
+            yield from self._stream(key)
+        except Exception as error:
+            single_flight.finish(key, future, error=error)
+            raise
+        except BaseException:  # Closed early (GeneratorExit) or interrupted; waiters must not hang
+            single_flight.finish(key, future, error=RuntimeError("The shared SWOT stream was stopped before it finished."))
+            raise
+        single_flight.finish(key, future, self.response)
+
+    def _stream(self, key):
+        route = self.route
+        reserved_tokens = _reserved_tokens(self.input_text)
+        prompt = _format_prompt(get_swot_chain(route.model_name), self.input_text)
+        started, queue_seconds = time.perf_counter(), []
+        full_message = None
+        model_used = route.model_name
+
+        def acquire():
+            queue_seconds.append(_acquire(reserved_tokens, "stream"))
+
+        def stream(model_name=route.model_name):
+            # Runs in a worker thread; chunks are tagged with their model and merged by the reader below
+            with _model_call("stream", model_name):
+                for chunk in get_swot_chain(model_name).last.stream(prompt):
+                    yield model_name, chunk
+
+        def fallback():
+            acquire()
+            return stream(fallback_model)
+
+        fallback_model = _fallback_model(route)
+        for model_used, chunk in resilience.stream_resilient(
+            get_resilience_policy(), stream, fallback if fallback_model else None,
+            acquire=acquire,
+        ):
+            full_message = chunk if full_message is None else full_message + chunk
+            text = _message_text(chunk)
+            if text:
+                yield text
+
+        if full_message is None:
+            self.response = {"content": "", "usage_metadata": None}
+        else:
+            self.response = _response_from_message(full_message)
+        self.response["model"], self.response["route"] = model_used, route._asdict()
+        _settle_rate_limit(reserved_tokens, self.response)
+        _record_route(route, self.response, prompt.to_string(), time.perf_counter() - started - sum(queue_seconds))
+        _store(self.input_text, key, self.response, False, route.model_name)
+
+
+# ✅ Token Accounting
+@functools.lru_cache(maxsize=256)
+def count_tokens(text):
+    """Counts tokens locally with tiktoken, or estimates them when it is unavailable."""
+    encoder = get_encoder()
+    if encoder is None:
+        return estimate_tokens(text)
+    return len(encoder.encode(text))
+
+
+def prompt_template_tokens(structured=False):
+    """Tokens the prompt template adds on top of the company details."""
+    return count_tokens(_prompt_text(structured).replace("{context}", ""))
+
+
+def token_usage(input_text, response, structured=False):
+    """Returns (prompt_tokens, response_tokens, source) for one analysis.
+
+    Uses the provider's usage metadata when the response carries it; otherwise counts
+    the full prompt (template plus input) and only the cleaned response text locally.
+    """
+    usage = response.get("usage_metadata") if isinstance(response, dict) else None
+    if usage and usage.get("input_tokens") is not None and usage.get("output_tokens") is not None:
+        return usage["input_tokens"], usage["output_tokens"], "provider"
+    with tracing.span("token_counting"):
+        prompt_tokens = prompt_template_tokens(structured) + count_tokens(input_text)
+        return prompt_tokens, count_tokens(response_text(response)), "local count"
+
+
+# ✅ Function to Extract Only SWOT Content
+def clean_swot_text(raw_response):
+    """Extracts the SWOT content and removes unwanted metadata."""
+    return response_text(raw_response)
+
+
+# ✅ Function to Extract Key Points for Visualization
+def extract_swot_key_points(swot_text):
+    """Extracts key points from the SWOT text to display in the visualization."""
+    # ✅ Show only **top 3 key points** per category in visualization
+    return parse_swot(swot_text).key_points(3)
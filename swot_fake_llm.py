@@ -0,0 +1,236 @@
+"""Deterministic offline chat model that writes realistic SWOT markdown.
+
+Select it with SWOT_LLM_BACKEND=fake. Content depends only on the prompt, so
+repeated runs are comparable; latency is drawn from a log-normal distribution
+(SWOT_FAKE_LATENCY_MS median, SWOT_FAKE_LATENCY_SIGMA spread) and streamed in
+SWOT_FAKE_CHUNK_CHARS sized chunks. No network access or API key is needed.
+
+Prompts that ask for a single section (the parallel quadrant mode) get only that
+section back, and take proportionally less of the generation time. Models whose
+name contains "flash" run SWOT_FAKE_FLASH_SPEEDUP times the latency.
+
+Fault injection: SWOT_FAKE_ERROR_RATE is the share of calls that fail with a
+503-style FakeServiceUnavailable after the time to first token, and
+SWOT_FAKE_SLOW_RATE the share that take SWOT_FAKE_SLOW_FACTOR times longer
+(a stalled request, for exercising timeouts and hedging).
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from typing import Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from swot_ratelimit import estimate_tokens
+
+# ✅ Phrase Banks for Generated SWOT Points
+_POINTS = {
+    "Strengths": [
+        ("Brand Recognition", "{company} is widely recognized in its core market, which lowers customer acquisition cost."),
+        ("Loyal Customer Base", "Repeat purchase rates are high and churn is low across key segments."),
+        ("Operational Efficiency", "Lean processes keep unit costs below most direct competitors."),
+        ("Proprietary Technology", "In-house technology is difficult for rivals to replicate quickly."),
+        ("Experienced Leadership", "The management team has a track record of disciplined execution."),
+        ("Strong Distribution Network", "Established channel partners give {company} broad market reach."),
+        ("Healthy Balance Sheet", "Low leverage leaves room to invest through downturns."),
+    ],
+    "Weaknesses": [
+        ("Limited Geographic Reach", "Revenue is concentrated in a small number of regions."),
+        ("High Customer Concentration", "A few large accounts make up a significant share of sales."),
+        ("Dependence on Key Suppliers", "Single-source components expose {company} to supply disruptions."),
+        ("Small Marketing Budget", "Brand spend lags larger competitors in crowded channels."),
+        ("Legacy Systems", "Ageing internal tooling slows product iteration."),
+        ("Thin Margins", "Pricing pressure leaves little buffer against cost increases."),
+    ],
+    "Opportunities": [
+        ("International Expansion", "Adjacent markets show rising demand for {company}'s offering."),
+        ("Strategic Partnerships", "Alliances with complementary providers could open new channels."),
+        ("Product Line Extension", "Existing customers are asking for related products and services."),
+        ("Digital Transformation", "Online sales and automation can lower costs and widen reach."),
+        ("Sustainability Demand", "Buyers increasingly favour providers with credible green credentials."),
+        ("Acquisitions", "Fragmented competitors create consolidation opportunities."),
+    ],
+    "Threats": [
+        ("Intense Competition", "Well-funded rivals are targeting the same customer segments."),
+        ("Economic Downturn", "A slowdown could reduce discretionary spending on {company}'s products."),
+        ("Regulatory Changes", "New compliance requirements may raise operating costs."),
+        ("Technological Disruption", "Emerging technologies could make current offerings obsolete."),
+        ("Supply Chain Volatility", "Input price swings and shipping delays threaten margins."),
+        ("Changing Consumer Preferences", "Shifts in taste could erode demand for core products."),
+    ],
+}
+
+
+_SINGLE_SECTION = re.compile(r"ONLY the \*\*(Strengths|Weaknesses|Opportunities|Threats)\*\* section")
+
+
+class FakeServiceUnavailable(ConnectionError):
+    """Injected transient failure, shaped like a provider's 503."""
+
+    status_code = 503
+
+
+def _prompt_text(messages):
+    return "\n".join(str(message.content) for message in messages)
+
+
+def _company_name(prompt):
+    """Uses the leading capitalized words of the company details as the name."""
+    name = []
+    for word in prompt.rsplit("Company Details:", 1)[-1].split()[:4]:
+        if not word[:1].isupper():
+            break
+        name.append(word.strip(".,;:"))
+    return " ".join(name) or "The company"
+
+
+def fake_swot_points(prompt):
+    """Picks deterministic SWOT points for a prompt, keyed by section name."""
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+    company = _company_name(prompt)
+    return {
+        section: [f"**{title}:** {body.format(company=company)}" for title, body in rng.sample(points, rng.randint(3, 5))]
+        for section, points in _POINTS.items()
+    }
+
+
+def requested_sections(prompt):
+    """The sections a prompt asks for: one for a quadrant prompt, otherwise all four."""
+    match = _SINGLE_SECTION.search(prompt)
+    return [match.group(1)] if match else list(_POINTS)
+
+
+def fake_swot_text(prompt):
+    """Builds deterministic SWOT markdown for a prompt."""
+    sections = []
+    wanted = requested_sections(prompt)
+    for section, points in fake_swot_points(prompt).items():
+        if section not in wanted:
+            continue
+        bullets = "\n".join(f"* {point}" for point in points)
+        sections.append(f"### {section}\n{bullets}")
+    return "\n\n".join(sections)
+
+
+def fake_swot_json(prompt):
+    """Builds the structured-mode JSON object for a prompt."""
+    return json.dumps({section.lower(): points for section, points in fake_swot_points(prompt).items()})
+
+
+def usage_metadata(prompt, text):
+    input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(text)
+    return {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+
+
+class FakeSWOTChatModel(BaseChatModel):
+    """Offline stand-in for ChatGoogleGenerativeAI with configurable latency and chunking."""
+
+    model_name: str = "fake-swot"
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.35
+    first_chunk_fraction: float = 0.3
+    chunk_chars: int = 24
+    seed: Optional[int] = None
+    error_rate: float = 0.0
+    slow_rate: float = 0.0
+    slow_factor: float = 10.0
+
+    _rng: random.Random = PrivateAttr(default_factory=random.Random)
+
+    def model_post_init(self, __context):
+        self._rng.seed(self.seed)
+
+    @classmethod
+    def from_env(cls, **overrides):
+        """Builds the model from SWOT_FAKE_* environment variables."""
+        settings = {
+            "latency_ms": float(os.getenv("SWOT_FAKE_LATENCY_MS", "800")),
+            "latency_sigma": float(os.getenv("SWOT_FAKE_LATENCY_SIGMA", "0.35")),
+            "chunk_chars": int(os.getenv("SWOT_FAKE_CHUNK_CHARS", "24")),
+            "seed": int(os.environ["SWOT_FAKE_SEED"]) if os.getenv("SWOT_FAKE_SEED") else None,
+            "error_rate": float(os.getenv("SWOT_FAKE_ERROR_RATE", "0")),
+            "slow_rate": float(os.getenv("SWOT_FAKE_SLOW_RATE", "0")),
+            "slow_factor": float(os.getenv("SWOT_FAKE_SLOW_FACTOR", "10")),
+        }
+        settings.update(overrides)
+        if "flash" in settings.get("model_name", ""):
+            settings["latency_ms"] *= float(os.getenv("SWOT_FAKE_FLASH_SPEEDUP", "0.35"))
+        return cls(**settings)
+
+    @property
+    def _llm_type(self):
+        return "fake-swot"
+
+    def _sample_latency(self):
+        """Total response time in seconds, log-normally distributed around latency_ms."""
+        if self.latency_ms <= 0:
+            return 0.0
+        return self._rng.lognormvariate(0.0, self.latency_sigma) * self.latency_ms / 1000
+
+    def _chunks(self, text):
+        size = max(1, self.chunk_chars)
+        return [text[start:start + size] for start in range(0, len(text), size)]
+
+    def _plan(self, messages, kwargs):
+        prompt = _prompt_text(messages)
+        if kwargs.get("response_mime_type") == "application/json":
+            text = fake_swot_json(prompt)
+        else:
+            text = fake_swot_text(prompt)
+        # Time to first token is paid in full; generation time scales with the sections written
+        share = len(requested_sections(prompt)) / len(_POINTS)
+        latency = self._sample_latency() * (self.first_chunk_fraction + (1 - self.first_chunk_fraction) * share)
+        if self.slow_rate and self._rng.random() < self.slow_rate:
+            latency *= self.slow_factor
+        fails = bool(self.error_rate) and self._rng.random() < self.error_rate
+        return prompt, text, latency, fails
+
+    def _fail(self):
+        raise FakeServiceUnavailable(f"{self.model_name}: injected 503 Service Unavailable")
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt, text, latency, fails = self._plan(messages, kwargs)
+        if fails:
+            time.sleep(latency * self.first_chunk_fraction)
+            self._fail()
+        time.sleep(latency)
+        message = AIMessage(content=text, usage_metadata=usage_metadata(prompt, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt, text, latency, fails = self._plan(messages, kwargs)
+        if fails:
+            await asyncio.sleep(latency * self.first_chunk_fraction)
+            self._fail()
+        await asyncio.sleep(latency)
+        message = AIMessage(content=text, usage_metadata=usage_metadata(prompt, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt, text, latency, fails = self._plan(messages, kwargs)
+        chunks = self._chunks(text)
+        time.sleep(latency * self.first_chunk_fraction)
+        if fails:
+            self._fail()
+        for piece in chunks:
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            time.sleep(latency * (1 - self.first_chunk_fraction) / len(chunks))
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage_metadata(prompt, text)))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt, text, latency, fails = self._plan(messages, kwargs)
+        chunks = self._chunks(text)
+        await asyncio.sleep(latency * self.first_chunk_fraction)
+        if fails:
+            self._fail()
+        for piece in chunks:
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            await asyncio.sleep(latency * (1 - self.first_chunk_fraction) / len(chunks))
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage_metadata(prompt, text)))
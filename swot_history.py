@@ -0,0 +1,155 @@
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from swot_cache import normalize_input
+from swot_core import get_resource
+from swot_parser import SWOTResult
+from swot_structured import JSON_KEYS
+
+# ✅ History Settings (override with environment variables)
+DEFAULT_HISTORY_PATH = os.getenv(
+    "SWOT_HISTORY_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "swot_analysis", "history.sqlite3"),
+)
+
+# One row of a history page; the analysis itself is loaded with HistoryStore.get(id)
+HistorySummary = namedtuple("HistorySummary", ["id", "company", "created_at", "mode"])
+HistoryEntry = namedtuple(
+    "HistoryEntry", ["id", "company", "created_at", "mode", "input_text", "result", "prompt_tokens", "response_tokens"]
+)
+
+
+def input_hash(input_text):
+    return hashlib.sha256(normalize_input(input_text).encode("utf-8")).hexdigest()
+
+
+def guess_company_name(input_text, max_words=4):
+    """The leading capitalized words of the description, or its first few words."""
+    words = normalize_input(input_text).split()
+    name = []
+    for word in words[:max_words]:
+        if not word[:1].isupper():
+            break
+        name.append(word.strip(".,;:()"))
+    return " ".join(name) or " ".join(words[:max_words]) or "Untitled"
+
+
+def _prefix_pattern(prefix):
+    """A LIKE pattern matching names that start with prefix, with wildcards escaped."""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class HistoryStore:
+    """Every completed analysis, persisted in SQLite (WAL mode) so past SWOTs load without a model call.
+
+    Rows are indexed by input hash, company name and timestamp; readers never block
+    the writer, so every Streamlit session and the API can share one file.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                " id INTEGER PRIMARY KEY,"
+                " input_hash TEXT NOT NULL,"
+                " company TEXT NOT NULL COLLATE NOCASE,"
+                " created_at REAL NOT NULL,"
+                " mode TEXT NOT NULL,"
+                " input_text TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " prompt_tokens INTEGER,"
+                " response_tokens INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS analyses_input_hash ON analyses (input_hash, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS analyses_company ON analyses (company, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS analyses_created_at ON analyses (created_at)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL and much cheaper per commit
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, input_text, swot, mode="single", prompt_tokens=None, response_tokens=None, company=None):
+        """Saves one analysis (a SWOTResult) and returns its id."""
+        result = {"text": swot.text}
+        result.update(zip(JSON_KEYS, swot.sections()))
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO analyses (input_hash, company, created_at, mode, input_text, result, prompt_tokens,"
+                " response_tokens) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    input_hash(input_text), company or guess_company_name(input_text), time.time(), mode,
+                    input_text, json.dumps(result, ensure_ascii=False), prompt_tokens, response_tokens,
+                ),
+            )
+            return cursor.lastrowid
+
+    def page(self, page=0, page_size=10, company=None):
+        """Newest-first summaries; company filters by a case-insensitive name prefix."""
+        query = "SELECT id, company, created_at, mode FROM analyses"
+        params = []
+        if company:
+            query += " WHERE company LIKE ? ESCAPE '\\'"
+            params.append(_prefix_pattern(company))
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params += [page_size, page * page_size]
+        with self._connect() as conn:
+            return [HistorySummary(*row) for row in conn.execute(query, params)]
+
+    def count(self, company=None):
+        with self._connect() as conn:
+            if company:
+                query = "SELECT COUNT(*) FROM analyses WHERE company LIKE ? ESCAPE '\\'"
+                return conn.execute(query, (_prefix_pattern(company),)).fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def get(self, entry_id):
+        """Returns the full HistoryEntry for an id, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, company, created_at, mode, input_text, result, prompt_tokens, response_tokens"
+                " FROM analyses WHERE id = ?",
+                (entry_id,),
+            ).fetchone()
+        return None if row is None else self._entry(row)
+
+    def latest_for_input(self, input_text):
+        """The most recent analysis of the same (whitespace-normalized) input, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, company, created_at, mode, input_text, result, prompt_tokens, response_tokens"
+                " FROM analyses WHERE input_hash = ? ORDER BY created_at DESC, id DESC LIMIT 1",
+                (input_hash(input_text),),
+            ).fetchone()
+        return None if row is None else self._entry(row)
+
+    @staticmethod
+    def _entry(row):
+        result = json.loads(row[5])
+        swot = SWOTResult(result["text"], *(result[key] for key in JSON_KEYS))
+        return HistoryEntry(*row[:5], swot, *row[6:])
+
+    def clear(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM analyses")
+
+
+def get_history_store():
+    return get_resource("history_store", HistoryStore)
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import re
+import zlib
+from collections import namedtuple
+
+import swot_tracing as tracing
+from swot_core import analyze_swot_async, count_tokens, parse_response, token_usage
+from swot_parser import SECTIONS, SWOTResult
+from swot_structured import swot_markdown
+
+# ✅ Document Mode Settings
+DEFAULT_CHUNK_TOKENS = int(os.getenv("SWOT_CHUNK_TOKENS", "3000"))
+DEFAULT_MAP_CONCURRENCY = int(os.getenv("SWOT_MAP_CONCURRENCY", "4"))
+DEFAULT_POINTS_PER_SECTION = int(os.getenv("SWOT_REDUCE_POINTS", "7"))
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_NON_WORD = re.compile(r"[^a-z0-9 ]+")
+
+# chunks: number of chunks analyzed; reused: how many came from the cache; tokens are summed over chunks
+MapReduceReport = namedtuple("MapReduceReport", ["result", "chunks", "reused", "prompt_tokens", "response_tokens"])
+
+
+def _pieces(text, max_chars):
+    """Paragraphs, with any paragraph longer than max_chars split at sentence ends."""
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            yield paragraph
+            continue
+        piece = ""
+        for sentence in _SENTENCE_END.split(paragraph):
+            if piece and len(piece) + len(sentence) + 1 > max_chars:
+                yield piece
+                piece = ""
+            piece = f"{piece} {sentence}" if piece else sentence
+        if piece:
+            yield piece
+
+
+def chunk_document(text, max_tokens=DEFAULT_CHUNK_TOKENS):
+    """Splits a long document into chunks of at most about max_tokens.
+
+    Chunk boundaries are content-defined: past half the limit, a chunk closes after
+    any paragraph whose checksum hits 1 in 4. An edit therefore only moves the
+    boundaries near it, and the other chunks keep their cache entries.
+    """
+    total_tokens = count_tokens(text)
+    chars_per_token = max(len(text), 1) / max(total_tokens, 1)
+    max_chars = int(max_tokens * chars_per_token)
+    chunks, current, size = [], [], 0
+    for piece in _pieces(text, max_chars):
+        if current and size + len(piece) > max_chars:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 2
+        if size >= max_chars // 2 and zlib.crc32(piece.encode("utf-8")) % 4 == 0:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _point_key(point):
+    """Normalized form used to spot the same point reported by several chunks."""
+    words = _NON_WORD.sub(" ", point.lower()).split()
+    return " ".join(words[:8])
+
+
+def reduce_results(results, limit=DEFAULT_POINTS_PER_SECTION):
+    """Merges per-chunk SWOTResults, deduplicating points and ranking them by how many chunks found them."""
+    if not results:
+        return SWOTResult(swot_markdown(*([] for _ in SECTIONS)), *([] for _ in SECTIONS))
+    merged = []
+    for section in zip(*(result.sections() for result in results)):
+        counts, first_seen = {}, {}
+        for points in section:
+            for point in points:
+                key = _point_key(point)
+                if not key:
+                    continue
+                counts[key] = counts.get(key, 0) + 1
+                first_seen.setdefault(key, (len(first_seen), point))
+        ranked = sorted(counts, key=lambda key: (-counts[key], first_seen[key][0]))
+        merged.append([first_seen[key][1] for key in ranked[:limit]])
+    return SWOTResult(swot_markdown(*merged), *merged)
+
+
+async def map_reduce_swot_async(text, concurrency=DEFAULT_MAP_CONCURRENCY, max_tokens=DEFAULT_CHUNK_TOKENS,
+                                structured=False, on_chunk=None, deep=False):
+    """Runs SWOT on every chunk (at most `concurrency` at once) and reduces them into one result.
+
+    on_chunk(done, total, chunk_result) is called as each chunk finishes.
+    """
+    with tracing.span("chunking"):
+        chunks = chunk_document(text, max_tokens)
+    semaphore = asyncio.Semaphore(concurrency)
+    results = [None] * len(chunks)
+    reused = done = prompt_tokens = response_tokens = 0
+
+    async def analyze_chunk(index, chunk):
+        nonlocal reused, done, prompt_tokens, response_tokens
+        async with semaphore:
+            with tracing.span(f"chunk:{index}", chars=len(chunk)):
+                response = await analyze_swot_async(chunk, structured, deep)
+        reused += bool(response.get("cache_match"))
+        chunk_prompt_tokens, chunk_response_tokens, _ = await asyncio.to_thread(token_usage, chunk, response, structured)
+        prompt_tokens += chunk_prompt_tokens
+        response_tokens += chunk_response_tokens
+        results[index] = parse_response(response, structured)
+        done += 1
+        if on_chunk is not None:
+            on_chunk(done, len(chunks), results[index])
+
+    await asyncio.gather(*(analyze_chunk(index, chunk) for index, chunk in enumerate(chunks)))
+    return MapReduceReport(reduce_results(results), len(chunks), reused, prompt_tokens, response_tokens)
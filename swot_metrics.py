@@ -0,0 +1,205 @@
+"""Process-local metrics in the Prometheus text exposition format.
+
+A small dependency-free subset of prometheus_client: labelled counters and
+histograms, plus gauges computed at scrape time. The HTTP API serves them at
+/metrics; the Streamlit app starts a local exporter on SWOT_METRICS_PORT.
+
+    curl -s localhost:9464/metrics
+"""
+import bisect
+import contextlib
+import http.server
+import os
+import threading
+import time
+
+# ✅ Metrics Settings
+METRICS_HOST = os.getenv("SWOT_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("SWOT_METRICS_PORT", "9464"))  # 0 disables the exporter
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 20, 40, 60, 120)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+_metrics = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Monotonic count, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name, self.documentation, self.labelnames = f"{name}_total", documentation, tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(str(labels.get(name, "")) for name in self.labelnames), 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values (seconds, tokens...)."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name, self.documentation, self.labelnames = name, documentation, tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # labels -> [per-bucket counts (last is +Inf), sum]
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def totals(self, **labels):
+        """(count, sum) of the observations with these labels."""
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            counts, total = self._series.get(key, ([0], 0.0))
+            return sum(counts), total
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        """Observes the duration of the with-block, in seconds, even when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(counts), total) for key, (counts, total) in self._series.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append((f"{self.name}_bucket", _format_labels(self.labelnames, key, [("le", le)]), cumulative))
+            lines.append((f"{self.name}_sum", _format_labels(self.labelnames, key), total))
+            lines.append((f"{self.name}_count", _format_labels(self.labelnames, key), cumulative))
+        return lines
+
+
+class Gauge:
+    """Value computed by func() at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, func):
+        self.name, self.documentation, self.func = name, documentation, func
+        _metrics.append(self)
+
+    def samples(self):
+        return [(self.name, "", self.func())]
+
+
+def render():
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in _metrics:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+# ✅ SWOT Metrics
+MODEL_CALL_SECONDS = Histogram("swot_model_call_seconds", "Model call latency.", ["mode"])
+QUEUE_WAIT_SECONDS = Histogram("swot_queue_wait_seconds", "Time spent waiting on the shared rate limiter.", ["mode"])
+PARSE_SECONDS = Histogram("swot_parse_seconds", "Time to parse a response into quadrants.", ["mode"], FAST_BUCKETS)
+RENDER_SECONDS = Histogram("swot_render_seconds", "Time to render a result in the Streamlit app.", ["mode"], FAST_BUCKETS)
+TOKENS = Counter("swot_tokens", "Tokens sent to and received from the model.", ["direction"])
+ERRORS = Counter("swot_errors", "Failed analyses by stage.", ["stage"])
+ROUTE_SECONDS = Histogram("swot_route_seconds", "Model latency per route, retries and fallback included.", ["route"])
+ROUTE_COST = Counter("swot_route_cost_usd", "Estimated model spend per route in US dollars, from list prices.", ["route"])
+CACHE_LOOKUPS = Counter("swot_cache_lookups", "Response cache lookups by result (exact, similar or miss).", ["result"])
+
+
+def cache_hit_ratio():
+    hits = CACHE_LOOKUPS.value(result="exact") + CACHE_LOOKUPS.value(result="similar")
+    total = hits + CACHE_LOOKUPS.value(result="miss")
+    return hits / total if total else 0.0
+
+
+def similar_hit_ratio():
+    total = sum(CACHE_LOOKUPS.value(result=result) for result in ("exact", "similar", "miss"))
+    return CACHE_LOOKUPS.value(result="similar") / total if total else 0.0
+
+
+Gauge("swot_cache_hit_ratio", "Share of lookups answered from the cache (exact or similar).", cache_hit_ratio)
+Gauge("swot_cache_similar_hit_ratio", "Share of lookups answered by a near-duplicate entry.", similar_hit_ratio)
+
+
+def record_usage(usage):
+    """Adds a response's usage metadata to the token counters."""
+    if not usage:
+        return
+    TOKENS.inc(usage.get("input_tokens") or 0, direction="prompt")
+    TOKENS.inc(usage.get("output_tokens") or 0, direction="response")
+
+
+# ✅ Local Exporter for Processes without an HTTP Server (the Streamlit app)
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the app log
+
+
+def start_exporter(host=METRICS_HOST, port=METRICS_PORT):
+    """Serves /metrics from a daemon thread; returns the server, or None when disabled or the port is taken."""
+    if port <= 0:
+        return None
+    try:
+        server = http.server.ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as error:
+        print(f"Metrics exporter not started on {host}:{port}: {error}")
+        return None
+    threading.Thread(target=server.serve_forever, name="swot-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,171 @@
+import re
+from collections import namedtuple
+
+SECTIONS = ("Strengths", "Weaknesses", "Opportunities", "Threats")
+
+# ✅ Precompiled Line Patterns
+_NAMES = "|".join(SECTIONS)
+
+# "### Strengths", "## 1. **Strengths** (internal)", "**Strengths:**", "**1. Strengths:**", "Key Strengths:",
+# "Strengths", "2) THREATS:"
+_HEADING = re.compile(
+    rf"""(?:
+        \#{{1,6}}[ \t]*(?:\d+[.)])?[ \t*_]*(?:[a-z]+[ \t]+)?(?P<hashed>{_NAMES})\b.*
+      | [*_]*[ \t]*(?:\d+[.)])?[ \t*_]*(?:[a-z]+[ \t]+)?(?P<plain>{_NAMES})[ \t*_:]*(?:\(.*\)[ \t*_:]*)?
+    )$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# "1. point", "2) point" ("* point", "- point", "• point" and "+ point" take a faster path; "*point" is a
+# bullet too, but "**bold**" is not)
+_NUMBERED_BULLET = re.compile(r"\d+[.)][ \t]+(?P<text>.+)")
+_BULLET_MARKERS = frozenset("-*•+")
+
+_METADATA_MARKER = "additional_kwargs"
+
+
+def response_text(raw_response):
+    """Extracts the SWOT content from a response and removes unwanted metadata."""
+    if isinstance(raw_response, dict) and "content" in raw_response:
+        text = raw_response["content"]
+    else:
+        text = str(raw_response)
+
+    cut = text.find(_METADATA_MARKER)
+    if cut != -1:
+        text = text[:cut].strip()  # Removes AI metadata from a stringified message
+        if text.startswith("content=") and len(text) > 9:
+            text = text[9:-1] if text[-1] == text[8] else text[9:]  # Unwraps content='...'
+    if "\\n" in text:
+        text = text.replace("\\n", "\n")  # Fixes escaped line breaks
+    return text.strip()
+
+
+def classify_line(line):
+    """Returns ("heading", section), ("bullet", text) or None for one line of SWOT text."""
+    line = line.strip()
+    if not line:
+        return None
+    if len(line) > 2 and line[0] in _BULLET_MARKERS and line[1] in " \t":
+        return "bullet", line[2:].lstrip()
+    match = _HEADING.match(line)
+    if match:
+        return "heading", (match.group("hashed") or match.group("plain")).capitalize()
+    if len(line) > 1 and line[0] in _BULLET_MARKERS and line[1] not in _BULLET_MARKERS:
+        return "bullet", line[1:].lstrip()
+    match = _NUMBERED_BULLET.match(line)
+    if match:
+        return "bullet", match.group("text")
+    return None
+
+
+# ✅ Parsed SWOT Result
+class SWOTResult:
+    """Cleaned SWOT text plus every bullet found under each section."""
+
+    __slots__ = ("text", "strengths", "weaknesses", "opportunities", "threats")
+
+    def __init__(self, text, strengths, weaknesses, opportunities, threats):
+        self.text = text
+        self.strengths = strengths
+        self.weaknesses = weaknesses
+        self.opportunities = opportunities
+        self.threats = threats
+
+    def sections(self):
+        return self.strengths, self.weaknesses, self.opportunities, self.threats
+
+    def key_points(self, limit=3):
+        """Returns the top points per section, in SECTIONS order."""
+        return tuple(points[:limit] for points in self.sections())
+
+    def __repr__(self):
+        counts = ", ".join(f"{name.lower()}={len(points)}" for name, points in zip(SECTIONS, self.sections()))
+        return f"SWOTResult({counts})"
+
+
+def parse_swot(raw_response):
+    """Cleans a response and splits it into sections in one linear pass.
+
+    Bullets that appear before the first heading are ignored.
+    """
+    text = response_text(raw_response)
+    points = {name: [] for name in SECTIONS}
+    current = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) > 2 and line[0] in _BULLET_MARKERS and line[1] in " \t":
+            if current is not None:  # Inlined fast path for the common "* point" line
+                current.append(line[2:].lstrip())
+            continue
+        kind = classify_line(line)
+        if kind is None:
+            continue
+        if kind[0] == "heading":
+            current = points[kind[1]]
+        elif current is not None:
+            current.append(kind[1])
+    return SWOTResult(text, *(points[name] for name in SECTIONS))
+
+
+# ✅ Parser Events
+# kind is "section_start", "bullet" or "section_end"; text is only set for bullets
+SWOTEvent = namedtuple("SWOTEvent", ["kind", "section", "text"])
+
+
+class SWOTStreamParser:
+    """Incrementally parses streamed SWOT text, emitting events as lines complete.
+
+    Only the unfinished last line is buffered, so feeding N characters costs O(N)
+    overall instead of reparsing the accumulated text on every chunk.
+    """
+
+    def __init__(self):
+        self.section = None
+        self.points = {name: [] for name in SECTIONS}
+        self._pending = []
+
+    def feed(self, chunk):
+        """Consumes one chunk of text and returns the events for every line it completed."""
+        if "\n" not in chunk:
+            self._pending.append(chunk)
+            return []
+
+        head, *lines = chunk.split("\n")
+        self._pending.append(head)
+        lines.insert(0, "".join(self._pending))
+        self._pending = [lines.pop()]
+
+        events = []
+        for line in lines:
+            self._parse_line(line, events)
+        return events
+
+    def close(self):
+        """Flushes the last partial line and ends the open section."""
+        events = []
+        self._parse_line("".join(self._pending), events)
+        self._pending = []
+        if self.section is not None:
+            events.append(SWOTEvent("section_end", self.section, None))
+            self.section = None
+        return events
+
+    def key_points(self, limit=3):
+        """Returns the top points per section, in SECTIONS order."""
+        return tuple(self.points[name][:limit] for name in SECTIONS)
+
+    def _parse_line(self, line, events):
+        kind = classify_line(line)
+        if kind is None:
+            return
+        if kind[0] == "heading":
+            if self.section is not None:
+                events.append(SWOTEvent("section_end", self.section, None))
+            self.section = kind[1]
+            events.append(SWOTEvent("section_start", self.section, None))
+        elif self.section is not None:
+            self.points[self.section].append(kind[1])
+            events.append(SWOTEvent("bullet", self.section, kind[1]))
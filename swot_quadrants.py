@@ -0,0 +1,60 @@
+import asyncio
+from collections import namedtuple
+
+import swot_metrics as metrics
+import swot_tracing as tracing
+from swot_core import analyze_quadrant_async, count_tokens, quadrant_prompt
+from swot_parser import SECTIONS, SWOTResult, parse_swot, response_text
+from swot_structured import swot_markdown
+
+# reused: how many quadrants came from the cache; tokens are summed over the four calls
+QuadrantReport = namedtuple("QuadrantReport", ["result", "reused", "prompt_tokens", "response_tokens"])
+
+
+def quadrant_points(section, response):
+    """Bullets of a single-section response, whether or not the model repeated the heading."""
+    with tracing.span("parse", section=section), metrics.PARSE_SECONDS.time(mode="quadrant"):
+        swot = parse_swot(f"### {section}\n{response_text(response)}")
+    return swot.sections()[SECTIONS.index(section)]
+
+
+def quadrant_tokens(input_text, section, response):
+    """(prompt_tokens, response_tokens) for one quadrant call, preferring the provider's counts."""
+    usage = response.get("usage_metadata")
+    if usage and usage.get("input_tokens") is not None and usage.get("output_tokens") is not None:
+        return usage["input_tokens"], usage["output_tokens"]
+    template_tokens = count_tokens(quadrant_prompt(section).replace("{context}", ""))
+    return template_tokens + count_tokens(input_text), count_tokens(response_text(response))
+
+
+def merge_quadrants(points):
+    """Joins the four per-section point lists into one SWOTResult with the usual markdown text."""
+    return SWOTResult(swot_markdown(*points), *points)
+
+
+async def quadrant_swot_async(input_text, on_quadrant=None, deep=False):
+    """Generates the four SWOT sections concurrently, one prompt each, and merges them.
+
+    Wall-clock latency is that of the slowest section rather than of the whole
+    answer. on_quadrant(section, points) is called as each section finishes.
+    """
+    points = [None] * len(SECTIONS)
+    reused = prompt_tokens = response_tokens = 0
+
+    async def analyze_section(index, section):
+        nonlocal reused, prompt_tokens, response_tokens
+        with tracing.span(f"quadrant:{section}"):
+            response = await analyze_quadrant_async(input_text, section, deep)
+        reused += bool(response.get("cache_match"))
+        # Token counting and parsing are CPU work; keep them off the event loop the API serves from
+        section_prompt_tokens, section_response_tokens = await asyncio.to_thread(
+            quadrant_tokens, input_text, section, response
+        )
+        prompt_tokens += section_prompt_tokens
+        response_tokens += section_response_tokens
+        points[index] = await asyncio.to_thread(quadrant_points, section, response)
+        if on_quadrant is not None:
+            on_quadrant(section, points[index])
+
+    await asyncio.gather(*(analyze_section(index, section) for index, section in enumerate(SECTIONS)))
+    return QuadrantReport(merge_quadrants(points), reused, prompt_tokens, response_tokens)
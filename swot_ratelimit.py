@@ -0,0 +1,106 @@
+import asyncio
+import os
+import threading
+import time
+
+# ✅ Rate Limit Settings (set a limit to 0 to disable it)
+DEFAULT_REQUESTS_PER_MINUTE = float(os.getenv("SWOT_REQUESTS_PER_MINUTE", "60"))
+DEFAULT_TOKENS_PER_MINUTE = float(os.getenv("SWOT_TOKENS_PER_MINUTE", "1000000"))
+EXPECTED_RESPONSE_TOKENS = int(os.getenv("SWOT_EXPECTED_RESPONSE_TOKENS", "1024"))
+
+
+def estimate_tokens(text):
+    """Cheap token estimate (~4 characters per token) used to reserve quota before a call."""
+    return len(text or "") // 4 + 1
+
+
+class TokenBucket:
+    """A per-minute bucket that may go into debt, so reservations queue in arrival order."""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount, now):
+        """Seconds until `amount` would be available, given everything already reserved."""
+        self._refill(now)
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount, now):
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+    def give_back(self, amount, now):
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Process-wide requests/min and tokens/min limiter shared by sync and async callers.
+
+    Every caller reserves its share up front and then sleeps until its slot, so
+    callers are served first come, first served instead of racing on retries.
+    """
+
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, tokens_per_minute=DEFAULT_TOKENS_PER_MINUTE):
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._lock = threading.Lock()
+
+    def _buckets(self, tokens):
+        if self._requests is not None:
+            yield self._requests, 1
+        if self._tokens is not None:
+            yield self._tokens, tokens
+
+    def current_wait(self, tokens=EXPECTED_RESPONSE_TOKENS):
+        """Seconds a new call of `tokens` would queue right now, without reserving anything."""
+        now = time.monotonic()
+        with self._lock:
+            return max((bucket.wait_for(amount, now) for bucket, amount in self._buckets(tokens)), default=0.0)
+
+    def reserve(self, tokens):
+        """Reserves one request and `tokens` tokens and returns how long to wait before calling."""
+        now = time.monotonic()
+        with self._lock:
+            wait = max((bucket.wait_for(amount, now) for bucket, amount in self._buckets(tokens)), default=0.0)
+            for bucket, amount in self._buckets(tokens):
+                bucket.take(amount, now)
+        return wait
+
+    def try_acquire(self, tokens):
+        """Reserves one request and `tokens` tokens only if no wait is needed; returns whether it did."""
+        now = time.monotonic()
+        with self._lock:
+            if any(bucket.wait_for(amount, now) for bucket, amount in self._buckets(tokens)):
+                return False
+            for bucket, amount in self._buckets(tokens):
+                bucket.take(amount, now)
+        return True
+
+    def acquire(self, tokens):
+        """Blocks the calling thread until the reservation is due; returns the time waited."""
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens):
+        """Awaits the reservation without blocking the event loop; returns the time waited."""
+        wait = self.reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def settle(self, reserved_tokens, actual_tokens):
+        """Corrects the token bucket once the real usage of a call is known."""
+        if self._tokens is None or actual_tokens is None:
+            return
+        with self._lock:
+            self._tokens.give_back(reserved_tokens - actual_tokens, time.monotonic())
@@ -0,0 +1,318 @@
+"""Retries, hedged requests and fallback for model calls.
+
+A call goes through up to 1 + SWOT_MAX_RETRIES attempts on transient errors,
+sleeping with full-jitter exponential backoff in between. Each attempt can be
+hedged: if it has not answered after the hedge delay (a fixed number of seconds,
+or the p95 of recent call latencies with SWOT_HEDGE=p95) a second identical
+request starts and the first response wins; the loser is cancelled (async) or
+abandoned (sync). When the primary model times out (SWOT_MODEL_TIMEOUT_SECONDS)
+or keeps failing, the fallback model answers instead. Streams are not hedged;
+their timeout is the time to the first chunk.
+
+Rate limiting stays outside the timed region: acquire() runs before each
+attempt starts its timeout and hedge clocks, and a hedge is only sent when
+can_hedge() grants a slot without waiting.
+"""
+import asyncio
+import collections
+import concurrent.futures
+import contextvars
+import os
+import queue
+import random
+import threading
+import time
+
+# ✅ Resilience Settings
+DEFAULT_MAX_RETRIES = int(os.getenv("SWOT_MAX_RETRIES", "2"))
+DEFAULT_BACKOFF_SECONDS = float(os.getenv("SWOT_RETRY_BACKOFF_SECONDS", "0.5"))
+DEFAULT_MAX_BACKOFF_SECONDS = float(os.getenv("SWOT_RETRY_MAX_BACKOFF_SECONDS", "8"))
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("SWOT_MODEL_TIMEOUT_SECONDS", "90"))  # 0 disables the timeout
+DEFAULT_HEDGE = os.getenv("SWOT_HEDGE", "off")  # "off", "p95" or a delay in seconds
+HEDGE_MIN_SAMPLES = 20
+
+_TRANSIENT_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+_TRANSIENT_NAMES = frozenset({
+    "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded", "InternalServerError", "TooManyRequests",
+    "Aborted", "RateLimitError", "APITimeoutError", "APIConnectionError",
+})
+
+
+class ModelTimeoutError(TimeoutError):
+    """The primary model did not answer within the configured timeout."""
+
+
+def _langchain_transient_errors():
+    """LangChain's provider-neutral 429, 5xx, connection and timeout errors (GoogleRateLimitError is one)."""
+    try:
+        from langchain_core.exceptions import (
+            ModelAPIError, ModelConnectionError, ModelRateLimitError, ModelTimeoutError as LangChainTimeoutError,
+        )
+    except ImportError:  # langchain-core before the ModelError hierarchy
+        return ()
+    return ModelRateLimitError, ModelAPIError, ModelConnectionError, LangChainTimeoutError
+
+
+def is_transient(error):
+    """Whether an error is worth retrying: connection problems, timeouts, 429 and 5xx responses."""
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    # Imported on the error path only, so importing this module stays cheap at startup
+    if isinstance(error, _langchain_transient_errors()):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int) and status in _TRANSIENT_STATUS:
+        return True
+    return any(cls.__name__ in _TRANSIENT_NAMES for cls in type(error).__mro__)
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF_SECONDS, cap=DEFAULT_MAX_BACKOFF_SECONDS, rng=random):
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return rng.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies, used to pick the hedge delay."""
+
+    def __init__(self, window=200):
+        self._samples = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction):
+        with self._lock:
+            if len(self._samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ResiliencePolicy:
+    """How one kind of model call is retried, hedged and timed out."""
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, backoff_seconds=DEFAULT_BACKOFF_SECONDS,
+                 max_backoff_seconds=DEFAULT_MAX_BACKOFF_SECONDS, timeout_seconds=DEFAULT_TIMEOUT_SECONDS,
+                 hedge=DEFAULT_HEDGE):
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout_seconds = timeout_seconds or None
+        self.hedge = hedge
+        self.latencies = LatencyTracker()
+        self.stats = collections.Counter()  # retries, hedges, hedge_wins, timeouts, fallbacks
+        self._stats_lock = threading.Lock()
+
+    def count(self, event):
+        with self._stats_lock:
+            self.stats[event] += 1
+
+    def hedge_delay(self):
+        """Seconds to wait before hedging, or None when hedging is off or there is no p95 yet."""
+        if self.hedge in ("", "off", "0"):
+            return None
+        if self.hedge == "p95":
+            return self.latencies.percentile(0.95)
+        return float(self.hedge)
+
+    def backoff(self, attempt):
+        return backoff_delay(attempt, self.backoff_seconds, self.max_backoff_seconds)
+
+
+# ✅ Async Calls
+async def _hedged(policy, attempt, can_hedge):
+    delay = policy.hedge_delay()
+    start = time.perf_counter()
+    first = asyncio.ensure_future(attempt())
+    tasks = {first}
+    try:
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and (can_hedge is None or can_hedge()):
+                policy.count("hedges")
+                tasks.add(asyncio.ensure_future(attempt()))
+        error = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not first:
+                        policy.count("hedge_wins")
+                    policy.latencies.observe(time.perf_counter() - start)
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def call_resilient(policy, attempt, fallback=None, acquire=None, can_hedge=None):
+    """Runs attempt() (a coroutine function) under the policy; returns (result, used_fallback).
+
+    acquire() is awaited before each try, outside the timeout; can_hedge() is
+    asked before sending a hedged request.
+    """
+    error = None
+    for attempt_number in range(policy.max_retries + 1):
+        if acquire is not None:
+            await acquire()
+        try:
+            return await asyncio.wait_for(_hedged(policy, attempt, can_hedge), policy.timeout_seconds), False
+        except asyncio.TimeoutError:
+            policy.count("timeouts")
+            error = ModelTimeoutError(f"No response within {policy.timeout_seconds:g}s")
+            break  # Another full timeout is too long to wait; go straight to the fallback
+        except Exception as exc:
+            if not is_transient(exc):
+                raise
+            error = exc
+            if attempt_number == policy.max_retries:
+                break
+            policy.count("retries")
+            await asyncio.sleep(policy.backoff(attempt_number))
+    if fallback is None:
+        raise error
+    policy.count("fallbacks")
+    return await fallback(), True
+
+
+# ✅ Sync Calls (threads; a losing or timed-out request is abandoned rather than cancelled)
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="swot-model")
+
+
+def _submit(func):
+    return _executor.submit(contextvars.copy_context().run, func)  # Keeps the caller's trace
+
+
+def _hedged_sync(policy, attempt, timeout, can_hedge=None):
+    delay = policy.hedge_delay()
+    start = time.perf_counter()
+    first = _submit(attempt)
+    futures = {first}
+    if delay is not None:
+        done, _ = concurrent.futures.wait(futures, timeout=delay)
+        if not done and (can_hedge is None or can_hedge()):
+            policy.count("hedges")
+            futures.add(_submit(attempt))
+    deadline = None if timeout is None else start + timeout
+    error = None
+    while futures:
+        remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+        done, futures = concurrent.futures.wait(futures, timeout=remaining, return_when=concurrent.futures.FIRST_COMPLETED)
+        if not done:
+            raise ModelTimeoutError(f"No response within {timeout:g}s")
+        for future in done:
+            if future.exception() is None:
+                if future is not first:
+                    policy.count("hedge_wins")
+                policy.latencies.observe(time.perf_counter() - start)
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+def call_resilient_sync(policy, attempt, fallback=None, acquire=None, can_hedge=None):
+    """Blocking variant of call_resilient; attempt, fallback and the hooks are plain functions."""
+    error = None
+    for attempt_number in range(policy.max_retries + 1):
+        if acquire is not None:
+            acquire()
+        try:
+            return _hedged_sync(policy, attempt, policy.timeout_seconds, can_hedge), False
+        except ModelTimeoutError as exc:
+            policy.count("timeouts")
+            error = exc
+            break
+        except Exception as exc:
+            if not is_transient(exc):
+                raise
+            error = exc
+            if attempt_number == policy.max_retries:
+                break
+            policy.count("retries")
+            time.sleep(policy.backoff(attempt_number))
+    if fallback is None:
+        raise error
+    policy.count("fallbacks")
+    return fallback(), True
+
+
+# ✅ Streams (produced in a worker thread so the wait for the first chunk can time out)
+_STREAM_END = object()
+
+
+def _produce(stream, items, stop):
+    iterator = stream()
+    try:
+        for item in iterator:
+            if stop.is_set():
+                return  # The consumer timed out or stopped reading; close the stream in this thread
+            items.put((item, None))
+        items.put((_STREAM_END, None))
+    except Exception as error:
+        items.put((_STREAM_END, error))
+    finally:
+        iterator.close()
+
+
+def _timed_stream(stream, timeout):
+    """Yields from stream(), raising ModelTimeoutError when its first item takes longer than timeout."""
+    items, stop = queue.Queue(), threading.Event()
+    producer = threading.Thread(
+        target=contextvars.copy_context().run, args=(_produce, stream, items, stop),  # Keeps the caller's trace
+        name="swot-stream", daemon=True,
+    )
+    producer.start()
+    waiting_for_first = True
+    try:
+        while True:
+            try:
+                item, error = items.get(timeout=timeout if waiting_for_first else None)
+            except queue.Empty:
+                raise ModelTimeoutError(f"No first chunk within {timeout:g}s") from None
+            if error is not None:
+                raise error
+            if item is _STREAM_END:
+                return
+            waiting_for_first = False
+            yield item
+    finally:
+        stop.set()  # A stalled stream is abandoned, like a timed-out sync call
+
+
+def stream_resilient(policy, stream, fallback=None, acquire=None):
+    """Yields from the generator function stream(), retrying transient errors raised before its first item.
+
+    Once an item has been yielded the caller has shown it, so a later error is
+    raised as is. When the first item does not arrive within the policy timeout
+    the fallback stream takes over. acquire() runs before each try, outside the timeout.
+    """
+    error = None
+    for attempt_number in range(policy.max_retries + 1):
+        if acquire is not None:
+            acquire()
+        started = False
+        try:
+            for item in _timed_stream(stream, policy.timeout_seconds):
+                started = True
+                yield item
+            return
+        except ModelTimeoutError as exc:
+            policy.count("timeouts")
+            error = exc
+            break
+        except Exception as exc:
+            if started or not is_transient(exc):
+                raise
+            error = exc
+            if attempt_number == policy.max_retries:
+                break
+            policy.count("retries")
+            time.sleep(policy.backoff(attempt_number))
+    if fallback is None:
+        raise error
+    policy.count("fallbacks")
+    yield from fallback()
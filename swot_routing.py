@@ -0,0 +1,44 @@
+"""Per-request model routing: a fast model for short inputs, the pro model for long ones.
+
+With the default "size" policy an input of at most SWOT_FAST_ROUTE_MAX_TOKENS
+tokens goes to SWOT_FAST_MODEL and anything longer to the pro model; "deep"
+requests always use the pro model. SWOT_ROUTING=pro or fast pins every request
+to one route. The chosen route is recorded on the response, in the trace and
+in per-route latency and cost metrics.
+"""
+import os
+from collections import namedtuple
+
+# ✅ Routing Settings
+DEFAULT_ROUTING = os.getenv("SWOT_ROUTING", "size")  # "size", or "pro" / "fast" to pin one route
+FAST_MODEL_NAME = os.getenv("SWOT_FAST_MODEL", "gemini-1.5-flash-latest")
+FAST_ROUTE_MAX_TOKENS = int(os.getenv("SWOT_FAST_ROUTE_MAX_TOKENS", "300"))
+ROUTES = ("fast", "pro")
+
+# ✅ List Prices in US Dollars per Million Tokens: (input, output)
+MODEL_PRICES = {
+    "gemini-1.5-pro-latest": (1.25, 5.00),
+    "gemini-1.5-flash-latest": (0.075, 0.30),
+}
+
+# model_name: the model asked first; reason: why the route was chosen, for traces and the UI
+Route = namedtuple("Route", ["name", "model_name", "reason"])
+
+
+def choose_route(input_tokens, pro_model_name, deep=False, policy=DEFAULT_ROUTING,
+                 fast_model_name=FAST_MODEL_NAME, max_fast_tokens=FAST_ROUTE_MAX_TOKENS):
+    """Picks the route for an input of `input_tokens` tokens."""
+    if deep:
+        return Route("pro", pro_model_name, "deep analysis")
+    if policy in ROUTES:
+        model_name = pro_model_name if policy == "pro" else fast_model_name
+        return Route(policy, model_name, f"SWOT_ROUTING={policy}")
+    if input_tokens <= max_fast_tokens:
+        return Route("fast", fast_model_name, f"{input_tokens} input tokens ≤ {max_fast_tokens}")
+    return Route("pro", pro_model_name, f"{input_tokens} input tokens > {max_fast_tokens}")
+
+
+def call_cost(model_name, prompt_tokens, response_tokens):
+    """Estimated cost of one call in US dollars; 0 for models without a known price."""
+    input_price, output_price = MODEL_PRICES.get(model_name, (0.0, 0.0))
+    return (prompt_tokens * input_price + response_tokens * output_price) / 1_000_000
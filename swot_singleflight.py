@@ -0,0 +1,75 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one in-flight call.
+
+    The first caller for a key (the leader) runs the work; everyone arriving while it
+    is running waits on the same future and receives its result or exception.
+    Sync and async callers can share one instance, across threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.executed = 0
+        self.collapsed = 0
+
+    def begin(self, key):
+        """Returns (future, is_leader); a leader must call finish() when its work is done."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.collapsed += 1
+                return future, False
+            future = self._in_flight[key] = Future()
+            self.executed += 1
+            return future, True
+
+    def finish(self, key, future, result=None, error=None):
+        """Publishes the leader's outcome to every waiter and closes the flight."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if future.cancelled():
+            return  # Nobody can read it any more; waiters that arrived later have their own flight
+        if error is not None:
+            future.set_exception(error)
+            future.exception()  # Mark as retrieved so an unwaited failure is not logged
+        else:
+            future.set_result(result)
+
+    def do(self, key, func):
+        """Runs func() once for all concurrent callers with this key."""
+        future, is_leader = self.begin(key)
+        if not is_leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as error:
+            self.finish(key, future, error=error)
+            raise
+        self.finish(key, future, result)
+        return result
+
+    async def do_async(self, key, func):
+        """Async variant of do(); func is a coroutine function."""
+        future, is_leader = self.begin(key)
+        if not is_leader:
+            # Shielded so a cancelled waiter does not cancel the shared future for everyone else
+            return await asyncio.shield(asyncio.wrap_future(future))
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self.finish(key, future, error=RuntimeError("The shared call was cancelled before it finished."))
+            raise
+        except BaseException as error:
+            self.finish(key, future, error=error)
+            raise
+        self.finish(key, future, result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {"executed": self.executed, "collapsed": self.collapsed, "in_flight": len(self._in_flight)}
@@ -0,0 +1,72 @@
+try:
+    import orjson
+
+    _loads = orjson.loads  # ✅ Faster JSON decoding when orjson is installed
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+
+    _loads = json.loads
+
+from swot_parser import SECTIONS, SWOTResult
+
+# ✅ JSON Keys and Schema for Structured Output
+JSON_KEYS = tuple(name.lower() for name in SECTIONS)
+
+SWOT_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {key: {"type": "array", "items": {"type": "string"}} for key in JSON_KEYS},
+    "required": list(JSON_KEYS),
+}
+
+# ✅ Define the AI Prompt for Structured SWOT Analysis
+swot_json_prompt = """
+You are an expert business consultant. Given the company information below, provide a **detailed** SWOT Analysis.
+
+Return ONLY a JSON object with exactly these four keys, each an array of 3-5 short strings:
+"strengths" (specific strengths related to the company), "weaknesses" (specific weaknesses),
+"opportunities" (external opportunities the company can leverage) and
+"threats" (threats, including competitors, market risks, etc.).
+
+Company Details:
+{context}
+"""
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a structured-mode response is not a valid SWOT JSON object."""
+
+
+def _strip_code_fence(content):
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[-1]
+        if content.endswith("```"):
+            content = content[:-3]
+    return content
+
+
+def swot_markdown(strengths, weaknesses, opportunities, threats):
+    """Renders the four lists as the same markdown the text mode displays."""
+    sections = []
+    for name, points in zip(SECTIONS, (strengths, weaknesses, opportunities, threats)):
+        bullets = "\n".join(f"* {point}" for point in points)
+        sections.append(f"### {name}\n{bullets}" if bullets else f"### {name}")
+    return "\n\n".join(sections)
+
+
+def parse_structured_swot(content):
+    """Decodes and validates a structured SWOT response, returning a SWOTResult."""
+    try:
+        data = _loads(_strip_code_fence(content))
+    except ValueError as error:
+        raise StructuredOutputError(f"Response is not valid JSON: {error}") from error
+    if not isinstance(data, dict):
+        raise StructuredOutputError("Response JSON is not an object.")
+
+    sections = []
+    for key in JSON_KEYS:
+        points = data.get(key)
+        if not isinstance(points, list) or not all(isinstance(point, str) for point in points):
+            raise StructuredOutputError(f'Response JSON needs "{key}" as a list of strings.')
+        sections.append([point.strip() for point in points if point.strip()])
+    return SWOTResult(swot_markdown(*sections), *sections)
@@ -0,0 +1,192 @@
+"""Lightweight per-request tracing exported as JSON lines.
+
+A trace is one request (a Generate click, an API call) with a request ID; spans
+time its stages (input prep, cache lookup, queue wait, prompt formatting, model
+call, parsing, token counting, render). The current trace lives in a context
+variable, so spans opened anywhere below it, including in asyncio tasks, attach
+to it, and span() is a no-op when no trace is active. Each finished trace
+appends one line per span to SWOT_TRACE_PATH; pages/trace_viewer.py draws them
+as a waterfall. Once the file passes SWOT_TRACE_MAX_BYTES it is rotated to
+<path>.1 (replacing the previous one), and readers scan from the end, so the
+cost of both stays bounded however long the app runs.
+"""
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+
+# ✅ Tracing Settings
+DEFAULT_TRACE_PATH = os.getenv(
+    "SWOT_TRACE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "swot_analysis", "traces.jsonl"),
+)
+TRACING_ENABLED = os.getenv("SWOT_TRACING", "1") != "0"
+DEFAULT_TRACE_MAX_BYTES = int(os.getenv("SWOT_TRACE_MAX_BYTES", str(20 * 1024 * 1024)))  # 0 disables rotation
+_READ_BLOCK_BYTES = 64 * 1024
+
+_current_trace = contextvars.ContextVar("swot_trace", default=None)
+_current_span = contextvars.ContextVar("swot_span", default=None)
+_export_lock = threading.Lock()
+
+
+class Trace:
+    """Spans recorded for one request; start offsets are relative to the trace start."""
+
+    def __init__(self, name, request_id=None, **attributes):
+        self.name = name
+        self.request_id = request_id or uuid.uuid4().hex[:16]
+        self.attributes = attributes
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.spans = []
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _new_span_id(self):
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def add_span(self, span_id, name, parent_id, start, end, attributes, error=None):
+        record = {
+            "request_id": self.request_id,
+            "trace": self.name,
+            "span_id": span_id,
+            "parent_id": parent_id,
+            "name": name,
+            "start_ms": round((start - self._start) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+            "timestamp": self.started_at + (start - self._start),
+            "attributes": attributes,
+        }
+        if error is not None:
+            record["error"] = error
+        with self._lock:
+            self.spans.append(record)
+
+    def export(self, path=DEFAULT_TRACE_PATH):
+        """Appends the spans, in start order, as JSON lines."""
+        spans = sorted(self.spans, key=lambda span: span["start_ms"])
+        if not spans:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(json.dumps(span, ensure_ascii=False, default=str) + "\n" for span in spans)
+        with _export_lock:
+            _rotate_if_full(path, len(lines.encode("utf-8")))
+            with open(path, "a", encoding="utf-8") as handle:
+                handle.write(lines)
+
+
+def _rotate_if_full(path, incoming_bytes, max_bytes=DEFAULT_TRACE_MAX_BYTES):
+    """Moves the trace file to <path>.1 when the next write would take it past max_bytes."""
+    if max_bytes <= 0:
+        return
+    try:
+        if os.path.getsize(path) + incoming_bytes <= max_bytes:
+            return
+        os.replace(path, path + ".1")
+    except FileNotFoundError:
+        pass  # Nothing written yet, or another process rotated it first
+
+
+@contextlib.contextmanager
+def span(name, **attributes):
+    """Times the with-block as a span of the current trace; yields the span's attribute dict."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield attributes
+        return
+    span_id = trace._new_span_id()
+    parent_id = _current_span.get()
+    token = _current_span.set(span_id)
+    start = time.perf_counter()
+    error = None
+    try:
+        yield attributes
+    except BaseException as exc:
+        error = exc.__class__.__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        trace.add_span(span_id, name, parent_id, start, time.perf_counter(), attributes, error)
+
+
+@contextlib.contextmanager
+def trace(name, request_id=None, path=DEFAULT_TRACE_PATH, **attributes):
+    """Starts a trace for one request, with a root span, and exports it when the block ends."""
+    if not TRACING_ENABLED:
+        yield None
+        return
+    current = Trace(name, request_id, **attributes)
+    token = _current_trace.set(current)
+    try:
+        with span(name, **attributes):
+            yield current
+    finally:
+        _current_trace.reset(token)
+        current.export(path)
+
+
+def current_request_id():
+    current = _current_trace.get()
+    return None if current is None else current.request_id
+
+
+def _lines_from_end(path):
+    """Yields the lines of a file last line first, reading it backwards in blocks."""
+    with open(path, "rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(_READ_BLOCK_BYTES, position)
+            position -= size
+            handle.seek(position)
+            lines = (handle.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)  # May continue in the previous block
+            yield from reversed(lines)
+        yield remainder
+
+
+def _records_from_end(path=DEFAULT_TRACE_PATH):
+    """Span records, newest first, from the trace file and then its rotated backup."""
+    for file_path in (path, path + ".1"):
+        if not os.path.exists(file_path):
+            continue
+        for line in _lines_from_end(file_path):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue  # Blank, or a line cut short by a crash
+
+
+def read_traces(path=DEFAULT_TRACE_PATH, limit=50):
+    """The most recent traces as {request_id: [span, ...]}, newest first.
+
+    Reads from the end of the file and stops after `limit` traces; a trace's spans
+    are written together, so a new request ID means the previous trace is complete.
+    """
+    traces = {}
+    for record in _records_from_end(path):
+        request_id = record["request_id"]
+        if request_id not in traces:
+            if len(traces) == limit:
+                break
+            traces[request_id] = []
+        traces[request_id].append(record)
+    return {request_id: spans[::-1] for request_id, spans in traces.items()}
+
+
+def read_trace(request_id, path=DEFAULT_TRACE_PATH):
+    """The spans of one request, or None when it is not in the trace file or its backup."""
+    spans = []
+    for record in _records_from_end(path):
+        if record["request_id"] == request_id:
+            spans.append(record)
+        elif spans:
+            break
+    return spans[::-1] or None
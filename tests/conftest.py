@@ -0,0 +1,16 @@
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Offline fake model and throwaway stores, set before any swot_* module reads its settings
+_STATE_DIR = tempfile.mkdtemp(prefix="swot-tests-")
+os.environ.setdefault("SWOT_LLM_BACKEND", "fake")
+os.environ.setdefault("SWOT_FAKE_LATENCY_MS", "10")
+os.environ.setdefault("SWOT_CACHE_PATH", os.path.join(_STATE_DIR, "cache.db"))
+os.environ.setdefault("SWOT_HISTORY_PATH", os.path.join(_STATE_DIR, "history.db"))
+os.environ.setdefault("SWOT_TRACE_PATH", os.path.join(_STATE_DIR, "traces.jsonl"))
+os.environ.setdefault("SWOT_METRICS_PORT", "0")
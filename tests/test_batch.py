@@ -0,0 +1,24 @@
+import asyncio
+import json
+
+import swot_core
+from swot_batch import run_batch
+
+
+def test_malformed_fallback_json_fails_one_row_not_the_batch(tmp_path, monkeypatch):
+    async def truncated_fallback(chain_for, input_text, reserved_tokens, mode, route):
+        if "Delta" in input_text:
+            return {"content": '{"strengths": ["Strong brand"', "usage_metadata": None,
+                    "model": swot_core.FALLBACK_MODEL_NAME, "route": route._asdict()}
+        return {"content": json.dumps({"strengths": ["Strong brand"], "weaknesses": [], "opportunities": [],
+                                       "threats": []}), "usage_metadata": None, "model": route.model_name,
+                "route": route._asdict()}
+
+    monkeypatch.setattr(swot_core, "_call_model_async", truncated_fallback)
+    output_path = tmp_path / "results.jsonl"
+    companies = [("delta", "Delta Corp sells batteries."), ("echo", "Echo Corp sells solar panels.")]
+
+    assert asyncio.run(run_batch(companies, str(output_path), structured=True, deep=True)) == (1, 1)
+    assert [json.loads(line)["id"] for line in output_path.read_text().splitlines()] == ["echo"]
+    key = swot_core.swot_cache_key("Delta Corp sells batteries.", True, swot_core.MODEL_NAME)
+    assert swot_core.get_response_cache().get(key) is None
@@ -0,0 +1,44 @@
+from swot_cache import SimilarityCache, minhash_signature, signature_similarity
+
+TEMPLATE = (
+    "{name} is a B2B SaaS company selling workflow automation software to mid-market manufacturers. "
+    "It has 200 employees, grew revenue 40% last year and competes with larger enterprise vendors. "
+    "Most customers are in Europe and North America, and churn has been rising since a price increase."
+)
+
+
+def test_templated_descriptions_of_different_companies_do_not_match():
+    acme, beta = TEMPLATE.format(name="Acme Corp"), TEMPLATE.format(name="Beta Corp")
+    assert signature_similarity(minhash_signature(acme), minhash_signature(beta)) >= 0.8  # Shingles alone collide
+
+    cache = SimilarityCache(threshold=0.8)
+    cache.add(acme, "acme-key")
+    assert cache.lookup(beta) is None
+
+
+def test_near_duplicate_of_the_same_company_matches():
+    acme = TEMPLATE.format(name="Acme Corp")
+    cache = SimilarityCache(threshold=0.8)
+    cache.add(acme, "acme-key")
+    match = cache.lookup(acme.replace("grew revenue 40%", "grew its revenue 40%"))
+    assert match is not None and match[0] == "acme-key"
+
+
+def test_evicted_entries_are_no_longer_found():
+    cache = SimilarityCache(threshold=0.8, max_entries=1)
+    cache.add(TEMPLATE.format(name="Acme Corp"), "acme-key")
+    cache.add(TEMPLATE.format(name="Beta Corp"), "beta-key")
+    assert cache.lookup(TEMPLATE.format(name="Acme Corp")) is None
+    assert cache.lookup(TEMPLATE.format(name="Beta Corp"))[0] == "beta-key"
+
+
+def test_cache_hits_do_not_report_the_route_of_the_original_request():
+    from swot_core import analyze_swot
+
+    details = TEMPLATE.format(name="Gamma Corp")
+    first = analyze_swot(details)
+    assert first["route"] is not None and "cache_match" not in first
+
+    second = analyze_swot(details)
+    assert second["cache_match"]["kind"] == "exact"
+    assert "route" not in second and second["model"] == first["model"]
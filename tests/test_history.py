@@ -0,0 +1,14 @@
+from swot_history import HistoryStore
+from swot_parser import parse_swot
+
+
+def test_latest_for_input_finds_the_newest_analysis_of_the_same_description(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    first = store.record("Acme Corp makes rockets.", parse_swot("### Strengths\n- Old"))
+    second = store.record("Acme Corp  makes rockets.\n", parse_swot("### Strengths\n- New"))
+    store.record("Beta Corp makes cars.", parse_swot("### Strengths\n- Other"))
+
+    entry = store.latest_for_input("Acme Corp makes rockets.")
+    assert entry.id == second != first
+    assert entry.result.strengths == ["New"]
+    assert store.latest_for_input("Gamma Corp makes boats.") is None
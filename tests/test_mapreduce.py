@@ -0,0 +1,18 @@
+from swot_mapreduce import chunk_document, reduce_results
+from swot_parser import SWOTResult
+
+
+def test_reduce_results_without_chunks_is_empty():
+    result = reduce_results([])
+    assert result.sections() == ([], [], [], [])
+    assert "Strengths" in result.text
+
+
+def test_reduce_results_ranks_points_found_by_more_chunks():
+    first = SWOTResult("", ["Strong brand"], [], [], [])
+    second = SWOTResult("", ["Loyal customers", "Strong brand."], [], [], [])
+    assert reduce_results([first, second]).strengths == ["Strong brand", "Loyal customers"]
+
+
+def test_blank_document_has_no_chunks():
+    assert chunk_document("  \n\n  ") == []
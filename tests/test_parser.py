@@ -0,0 +1,47 @@
+from swot_parser import SWOTStreamParser, parse_swot
+
+RESPONSE = (
+    "### Strengths\n- Strong brand\n- Loyal customers\n"
+    "### Weaknesses\n- High costs\n"
+    "### Opportunities\n- New markets\n"
+    "### Threats\n- New entrants\n- Price war"
+)
+
+
+def test_stream_parser_close_emits_the_last_line_and_section_end():
+    parser = SWOTStreamParser()
+    events = []
+    for start in range(0, len(RESPONSE), 7):
+        events.extend(parser.feed(RESPONSE[start:start + 7]))
+    assert parser.points["Threats"] == ["New entrants"]
+
+    closing = parser.close()
+    assert parser.points["Threats"] == ["New entrants", "Price war"]
+    assert [(event.kind, event.section) for event in closing][-1] == ("section_end", "Threats")
+    assert parser.key_points(3) == parse_swot(RESPONSE).key_points(3)
+
+
+def test_bold_numbered_and_prefixed_headings():
+    response = (
+        "**1. Strengths:**\n- Strong brand\n"
+        "Key Weaknesses:\n- High costs\n"
+        "### Key Opportunities\n- New markets\n"
+        "**4) Threats**\n- Price war\n"
+    )
+    assert parse_swot(response).key_points(3) == (["Strong brand"], ["High costs"], ["New markets"], ["Price war"])
+
+
+def test_bullets_without_a_space_after_the_marker():
+    response = "### Strengths\n*Strong brand\n-Loyal customers\n**Not a bullet**\n### Threats\n•Price war\n"
+    result = parse_swot(response)
+    assert result.strengths == ["Strong brand", "Loyal customers"]
+    assert result.threats == ["Price war"]
+
+
+def test_stream_parser_matches_parse_swot_on_the_new_forms():
+    response = "**1. Strengths:**\n*Strong brand\nKey Threats:\n-Price war\n"
+    parser = SWOTStreamParser()
+    for character in response:
+        parser.feed(character)
+    parser.close()
+    assert parser.key_points(3) == parse_swot(response).key_points(3) == (["Strong brand"], [], [], ["Price war"])
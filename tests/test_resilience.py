@@ -0,0 +1,109 @@
+import pytest
+
+import swot_resilience as resilience
+
+
+def test_gemini_rate_limit_error_is_transient():
+    from langchain_google_genai.chat_models import GoogleAPIError, GoogleInvalidRequestError, GoogleRateLimitError
+
+    assert resilience.is_transient(GoogleRateLimitError("429 RESOURCE_EXHAUSTED"))
+    assert resilience.is_transient(GoogleAPIError(503, {"error": {"message": "unavailable"}}))
+    assert not resilience.is_transient(GoogleInvalidRequestError("400 INVALID_ARGUMENT"))
+
+
+def test_langchain_model_errors_are_transient():
+    from langchain_core.exceptions import ModelAPIError, ModelRateLimitError
+
+    assert resilience.is_transient(ModelRateLimitError("429"))
+    assert resilience.is_transient(ModelAPIError("500"))
+    assert not resilience.is_transient(ValueError("bad prompt"))
+
+
+def test_rate_limit_error_is_retried_then_answered():
+    from langchain_google_genai.chat_models import GoogleRateLimitError
+
+    policy = resilience.ResiliencePolicy(max_retries=2, backoff_seconds=0, timeout_seconds=0, hedge="off")
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        if len(calls) < 3:
+            raise GoogleRateLimitError("429 RESOURCE_EXHAUSTED")
+        return "answer"
+
+    assert resilience.call_resilient_sync(policy, attempt) == ("answer", False)
+    assert policy.stats["retries"] == 2
+
+
+def test_rate_limit_error_falls_back_after_retries():
+    from langchain_google_genai.chat_models import GoogleRateLimitError
+
+    policy = resilience.ResiliencePolicy(max_retries=1, backoff_seconds=0, timeout_seconds=0, hedge="off")
+
+    def attempt():
+        raise GoogleRateLimitError("429 RESOURCE_EXHAUSTED")
+
+    assert resilience.call_resilient_sync(policy, attempt, lambda: "fallback") == ("fallback", True)
+    with pytest.raises(GoogleRateLimitError):
+        resilience.call_resilient_sync(policy, attempt)
+
+
+def test_queue_wait_does_not_count_toward_timeout():
+    import asyncio
+
+    policy = resilience.ResiliencePolicy(max_retries=0, timeout_seconds=0.1, hedge="off")
+
+    async def acquire():
+        await asyncio.sleep(0.2)  # Longer than the timeout
+
+    async def attempt():
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    assert asyncio.run(resilience.call_resilient(policy, attempt, acquire=acquire)) == ("answer", False)
+    assert policy.stats["timeouts"] == 0
+
+
+def test_hedge_is_skipped_without_a_free_slot():
+    import time
+
+    policy = resilience.ResiliencePolicy(max_retries=0, timeout_seconds=0, hedge="0.01")
+
+    def attempt():
+        time.sleep(0.05)
+        return "answer"
+
+    assert resilience.call_resilient_sync(policy, attempt, can_hedge=lambda: False) == ("answer", False)
+    assert policy.stats["hedges"] == 0
+
+
+def test_stream_without_a_first_chunk_in_time_falls_back():
+    import time
+
+    policy = resilience.ResiliencePolicy(max_retries=2, timeout_seconds=0.1, hedge="off")
+
+    def stalled():
+        time.sleep(0.5)
+        yield "late"
+
+    def fallback():
+        yield "fallback"
+
+    started = time.perf_counter()
+    assert list(resilience.stream_resilient(policy, stalled, fallback)) == ["fallback"]
+    assert time.perf_counter() - started < 0.4
+    assert policy.stats["timeouts"] == 1 and policy.stats["fallbacks"] == 1
+
+
+def test_stream_timeout_covers_only_the_first_chunk():
+    import time
+
+    policy = resilience.ResiliencePolicy(max_retries=0, timeout_seconds=0.1, hedge="off")
+
+    def slow_after_first():
+        yield "first"
+        time.sleep(0.2)
+        yield "second"
+
+    assert list(resilience.stream_resilient(policy, slow_after_first)) == ["first", "second"]
+    assert policy.stats["timeouts"] == 0
@@ -0,0 +1,22 @@
+import time
+
+import swot_core
+import swot_metrics as metrics
+from swot_ratelimit import RateLimiter
+
+
+def test_route_latency_excludes_rate_limit_queue_wait(monkeypatch):
+    class SlowQueue(RateLimiter):
+        def acquire(self, tokens):
+            time.sleep(0.3)
+            return 0.3
+
+    monkeypatch.setattr(swot_core, "get_rate_limiter", lambda: SlowQueue(0, 0))
+    route = swot_core.route_for("Zeta Corp builds wind turbines.")
+    calls_before, seconds_before = metrics.ROUTE_SECONDS.totals(route=route.name)
+
+    swot_core.analyze_swot("Zeta Corp builds wind turbines.")
+
+    calls, seconds = metrics.ROUTE_SECONDS.totals(route=route.name)
+    assert calls == calls_before + 1
+    assert seconds - seconds_before < 0.3
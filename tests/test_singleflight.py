@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from swot_singleflight import SingleFlight
+
+
+def test_cancelled_waiter_does_not_affect_other_waiters():
+    single_flight = SingleFlight()
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "result"
+
+        leader = asyncio.ensure_future(single_flight.do_async("key", work))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(single_flight.do_async("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        return await asyncio.gather(leader, waiters[0], waiters[1], return_exceptions=True)
+
+    leader_result, cancelled, other = asyncio.run(scenario())
+    assert leader_result == "result"
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert other == "result"
+    assert single_flight.stats() == {"executed": 1, "collapsed": 2, "in_flight": 0}
+
+
+def test_cancelled_leader_fails_waiters_instead_of_cancelling_them():
+    single_flight = SingleFlight()
+
+    async def scenario():
+        async def work():
+            await asyncio.sleep(10)
+
+        leader = asyncio.ensure_future(single_flight.do_async("key", work))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(single_flight.do_async("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await asyncio.gather(leader, waiter, return_exceptions=True)
+
+    cancelled, waiter_error = asyncio.run(scenario())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert isinstance(waiter_error, RuntimeError)
+
+
+def test_sync_callers_share_one_call():
+    single_flight = SingleFlight()
+    assert single_flight.do("key", lambda: 42) == 42
+    with pytest.raises(ValueError):
+        single_flight.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
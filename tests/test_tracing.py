@@ -0,0 +1,37 @@
+import os
+
+import swot_tracing as tracing
+
+
+def _export_traces(path, count):
+    request_ids = []
+    for index in range(count):
+        with tracing.trace("test_request", path=path, index=index) as current:
+            with tracing.span("stage"):
+                pass
+        request_ids.append(current.request_id)
+    return request_ids
+
+
+def test_read_traces_returns_the_newest_first_from_the_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, "_READ_BLOCK_BYTES", 64)  # Lines straddle block boundaries
+    path = str(tmp_path / "traces.jsonl")
+    request_ids = _export_traces(path, 5)
+
+    traces = tracing.read_traces(path, limit=3)
+    assert list(traces) == request_ids[:1:-1]
+    assert [span["name"] for span in traces[request_ids[-1]]] == ["test_request", "stage"]
+
+
+def test_trace_file_is_rotated_and_backup_still_readable(tmp_path, monkeypatch):
+    path = str(tmp_path / "traces.jsonl")
+    original_rotate = tracing._rotate_if_full
+    monkeypatch.setattr(tracing, "_rotate_if_full", lambda path, incoming: original_rotate(path, incoming, 1500))
+    request_ids = _export_traces(path, 10)
+
+    assert os.path.getsize(path) <= 1500
+    assert os.path.exists(path + ".1")
+    oldest_kept = [request_id for request_id in request_ids if tracing.read_trace(request_id, path)]
+    assert oldest_kept == request_ids[-len(oldest_kept):]
+    assert len(oldest_kept) < len(request_ids)  # The oldest were dropped with the previous backup
+    assert tracing.read_trace("missing", path) is None